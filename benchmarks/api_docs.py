@@ -1,10 +1,14 @@
 """Introspect the Metaflow client to generate an API reference and keyword search."""
 
+import functools
+import heapq
 import inspect
+import io
+from collections import Counter
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class APIEntry:
     """A single API member (method, property, or function)."""
 
@@ -14,35 +18,73 @@ class APIEntry:
     signature: str
     docstring: str
     search_text: str  # lowercased concatenation for keyword matching
+    tokens: frozenset[str] = frozenset()  # search_text tokenized once at creation
+
+
+@functools.lru_cache(maxsize=1024)
+def _signature_str(fn) -> str:
+    """Stringify a callable's signature, cached per function object.
+
+    Inherited methods are shared across the introspected classes, so the
+    (expensive) signature parse runs once per underlying function.
+    """
+    try:
+        return str(inspect.signature(fn))
+    except (ValueError, TypeError):
+        return "(...)"
 
 
 def _get_members(cls):
-    """Extract public methods and properties from a class."""
+    """Extract public methods and properties from a class.
+
+    Walks ``cls.__mro__`` and reads each class ``__dict__`` directly instead
+    of using ``inspect.getmembers``, which getattr()s every inherited
+    attribute (triggering descriptors) across the full hierarchy. Private
+    names are skipped before any descriptor work happens.
+    """
     entries = []
-    for name, obj in inspect.getmembers(cls):
-        if name.startswith("_"):
-            continue
-        class_name = cls.__name__
-        if isinstance(obj, property) or isinstance(inspect.getattr_static(cls, name, None), property):
+    class_name = cls.__name__
+    members: dict[str, object] = {}
+    for base in cls.__mro__:
+        for name, raw in base.__dict__.items():
+            if name.startswith("_") or name in members:
+                continue
+            members[name] = raw
+    for name in sorted(members):  # match getmembers' alphabetical order
+        raw = members[name]
+        if isinstance(raw, property):
+            # raw is the undecorated descriptor straight from the class dict,
+            # so no inspect.getattr_static round-trip is needed.
             kind = "property"
             sig = f"{class_name}.{name}"
-            doc = (obj.fget.__doc__ if isinstance(obj, property) and obj.fget else "") or ""
-        elif callable(obj):
+            doc = (raw.fget.__doc__ if raw.fget else "") or ""
+        else:
+            obj = getattr(cls, name, None)
+            if not callable(obj):
+                continue
             kind = "method"
             try:
-                sig = f"{class_name}.{name}{inspect.signature(obj)}"
-            except (ValueError, TypeError):
+                sig = f"{class_name}.{name}{_signature_str(obj)}"
+            except TypeError:  # unhashable callable
                 sig = f"{class_name}.{name}(...)"
-            doc = inspect.getdoc(obj) or ""
-        else:
-            continue
+            # Fast path: read __doc__ directly; only fall back to
+            # inspect.getdoc's MRO search when the method itself has none.
+            raw_doc = obj.__doc__
+            doc = inspect.cleandoc(raw_doc) if raw_doc else (inspect.getdoc(obj) or "")
         search_text = f"{class_name} {name} {kind} {doc}".lower()
-        entries.append(APIEntry(class_name, name, kind, sig, doc, search_text))
+        entries.append(
+            APIEntry(class_name, name, kind, sig, doc, search_text, frozenset(search_text.split()))
+        )
     return entries
 
 
+@functools.lru_cache(maxsize=1)
 def generate_api_reference() -> list[APIEntry]:
-    """Introspect Metaflow client classes and return all API entries."""
+    """Introspect Metaflow client classes and return all API entries.
+
+    The result is cached for the lifetime of the process (introspection is
+    deterministic and expensive); callers must not mutate the returned list.
+    """
     from metaflow import Flow, Run, Step, Task
     from metaflow.client.core import DataArtifact, Metaflow, namespace
     from metaflow.client import get_metadata
@@ -53,50 +95,66 @@ def generate_api_reference() -> list[APIEntry]:
 
     # Add standalone functions
     for fn_name, fn in [("namespace", namespace), ("get_metadata", get_metadata)]:
-        try:
-            sig = f"{fn_name}{inspect.signature(fn)}"
-        except (ValueError, TypeError):
-            sig = f"{fn_name}(...)"
+        sig = f"{fn_name}{_signature_str(fn)}"
         doc = inspect.getdoc(fn) or ""
         search_text = f"{fn_name} function {doc}".lower()
-        entries.append(APIEntry("(module)", fn_name, "function", sig, doc, search_text))
+        entries.append(
+            APIEntry("(module)", fn_name, "function", sig, doc, search_text, frozenset(search_text.split()))
+        )
 
     return entries
 
 
+# Static trailer appended to every rendered reference; built once at import.
+_COMMON_PATTERNS_MD = """
+## Common Patterns
+```python
+from metaflow import Metaflow, Flow, Run, Step, Task, namespace
+namespace(None)  # see all runs
+for flow in Metaflow():  # list all flows
+for run in Flow('MyFlow'):  # iterate runs (newest first)
+run.successful, run.finished, run.finished_at  # run status
+for step in run:  # iterate steps
+for task in step:  # iterate tasks
+task.stdout, task.stderr, task.exception  # task details
+for artifact in task:  # iterate artifacts
+task['name'].data  # get artifact value
+```"""
+
+
+@functools.lru_cache(maxsize=1)
+def get_api_reference_markdown() -> str:
+    """Return the rendered markdown API reference, built once per process.
+
+    All consumers (skill prompts, benchmark workers in the same process)
+    share the single rendered string instead of re-running introspection
+    and formatting per instance.
+    """
+    return format_api_reference(generate_api_reference())
+
+
 def format_api_reference(entries: list[APIEntry]) -> str:
     """Render API entries as a markdown reference for the skill system prompt."""
-    lines = ["# Metaflow Python Client API Reference", ""]
+    buf = io.StringIO()
+    buf.write("# Metaflow Python Client API Reference\n\n")
     current_class = None
     for e in entries:
         if e.class_name != current_class:
             current_class = e.class_name
-            lines.append(f"## {current_class}")
-            lines.append("")
+            buf.write(f"## {current_class}\n\n")
         doc_summary = e.docstring.split("\n")[0] if e.docstring else ""
-        lines.append(f"- `{e.signature}` — {doc_summary}")
-    lines.append("")
-    lines.append("## Common Patterns")
-    lines.append("```python")
-    lines.append("from metaflow import Metaflow, Flow, Run, Step, Task, namespace")
-    lines.append("namespace(None)  # see all runs")
-    lines.append("for flow in Metaflow():  # list all flows")
-    lines.append("for run in Flow('MyFlow'):  # iterate runs (newest first)")
-    lines.append("run.successful, run.finished, run.finished_at  # run status")
-    lines.append("for step in run:  # iterate steps")
-    lines.append("for task in step:  # iterate tasks")
-    lines.append("task.stdout, task.stderr, task.exception  # task details")
-    lines.append("for artifact in task:  # iterate artifacts")
-    lines.append("task['name'].data  # get artifact value")
-    lines.append("```")
-    return "\n".join(lines)
+        buf.write(f"- `{e.signature}` — {doc_summary}\n")
+    buf.write(_COMMON_PATTERNS_MD)
+    return buf.getvalue()
 
 
+@functools.lru_cache(maxsize=1)
 def generate_api_schema() -> list[dict]:
     """Return the MCP tool function schemas as a list of dicts.
 
     This is the server-side schema that CF Code Mode's search phase queries.
     Each dict has: name, signature, docstring, parameters (list of param dicts).
+    Cached per-process; callers must not mutate the returned list.
     """
     import inspect as _inspect
     from metaflow_mcp_server.server import (
@@ -130,17 +188,53 @@ def generate_api_schema() -> list[dict]:
     return schema
 
 
+def dump_api_schema_cache(path: str) -> None:
+    """Serialize the server tool schemas to a JSON file.
+
+    Written once at benchmark startup so Python snippets spawned at runtime
+    (CF Code Mode's search phase) can point METAFLOW_MCP_SCHEMA_CACHE here
+    and load the schemas in O(1) instead of re-running inspect.signature on
+    every tool function per subprocess.
+    """
+    import json
+
+    from metaflow_mcp_server.server import get_tool_schemas
+
+    with open(path, "w") as f:
+        json.dump(get_tool_schemas(), f, indent=2)
+
+
+# token -> posting list of entry indices, built once per entries list.
+# Keyed by id(); the value keeps a strong reference to the entries list so
+# the id cannot be recycled while the index is alive.
+_INDEX_CACHE: dict[int, tuple[list[APIEntry], dict[str, list[int]]]] = {}
+
+
+def _inverted_index(entries: list[APIEntry]) -> dict[str, list[int]]:
+    """Return (building if needed) the inverted index for an entries list."""
+    cached = _INDEX_CACHE.get(id(entries))
+    if cached is not None:
+        return cached[1]
+    index: dict[str, list[int]] = {}
+    for i, e in enumerate(entries):
+        for token in e.tokens or frozenset(e.search_text.split()):
+            index.setdefault(token, []).append(i)
+    _INDEX_CACHE[id(entries)] = (entries, index)
+    return index
+
+
 def search_api(query: str, entries: list[APIEntry], top_k: int = 10) -> str:
     """Keyword overlap search over API entries. Returns formatted matches."""
     query_words = set(query.lower().split())
-    scored = []
-    for e in entries:
-        entry_words = set(e.search_text.split())
-        overlap = len(query_words & entry_words)
-        if overlap > 0:
-            scored.append((overlap, e))
-    scored.sort(key=lambda x: -x[0])
-    results = scored[:top_k]
+    if not query_words:
+        return "No matching API entries found."
+    index = _inverted_index(entries)
+    counts = Counter()
+    for word in query_words:
+        counts.update(index.get(word, ()))
+    # Build in entry order so ties keep the original ordering.
+    scored = [(counts[i], entries[i]) for i in sorted(counts)]
+    results = heapq.nlargest(top_k, scored, key=lambda x: x[0])
 
     if not results:
         return "No matching API entries found."
@@ -149,6 +243,7 @@ def search_api(query: str, entries: list[APIEntry], top_k: int = 10) -> str:
     for _, e in results:
         lines.append(f"**{e.kind}**: `{e.signature}`")
         if e.docstring:
-            lines.append(f"  {e.docstring[:200]}")
+            doc = e.docstring if len(e.docstring) <= 200 else e.docstring[:200]
+            lines.append(f"  {doc}")
         lines.append("")
     return "\n".join(lines)
@@ -12,12 +12,14 @@ class SkillApproach(Approach):
     would type `/metaflow <question>` in a real session.
     """
 
+    _SYSTEM_PROMPT = "You are a Metaflow assistant."
+
     @property
     def name(self) -> str:
         return "skill"
 
     def get_system_prompt(self) -> str:
-        return "You are a Metaflow assistant."
+        return self._SYSTEM_PROMPT
 
     def transform_user_prompt(self, prompt: str) -> str:
         return f"/metaflow {prompt}"
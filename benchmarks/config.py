@@ -30,13 +30,21 @@ JUDGE_MODEL = "sonnet"  # kept for backward compat; multi-judge uses JUDGE_MODEL
 JUDGE_MODELS = ["sonnet", "opus"]
 
 
+# Per-token rates precomputed from PRICING so estimate_cost is a single
+# lookup plus two multiplies (it runs once per result in reporting loops).
+_RATES_PER_TOKEN = {
+    model: (rates["input"] / 1_000_000, rates["output"] / 1_000_000)
+    for model, rates in PRICING.items()
+}
+
+
 def estimate_cost(model_id: str, input_tokens: int, output_tokens: int) -> float:
     """Estimate cost in USD for a given model and token counts."""
-    rates = PRICING.get(model_id, {"input": 0.0, "output": 0.0})
-    return (input_tokens * rates["input"] + output_tokens * rates["output"]) / 1_000_000
+    in_rate, out_rate = _RATES_PER_TOKEN.get(model_id, (0.0, 0.0))
+    return input_tokens * in_rate + output_tokens * out_rate
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskResult:
     """Result of running a single (approach, model, task, trial) combination."""
 
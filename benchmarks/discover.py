@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class TestContext:
     """Context discovered from the live Metaflow backend for parameterizing tasks."""
 
@@ -40,12 +40,18 @@ def discover_flows(min_runs: int = 3, max_flows: int = 5, only_flows: list[str]
         except Exception:
             continue
 
+        # Stop scanning as soon as we have enough runs AND a failure; each
+        # extra run touched is a metadata round-trip. The 20-run cap only
+        # applies when no failure turns up.
+        scan_floor = max(min_runs, 10)
         runs = []
         has_failure = False
         for run in flow:
             runs.append(run)
             if run.finished and not run.successful:
                 has_failure = True
+            if has_failure and len(runs) >= scan_floor:
+                break
             if len(runs) >= 20:
                 break
 
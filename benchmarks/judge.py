@@ -1,10 +1,7 @@
 """LLM-as-judge correctness scoring via the claude-relay."""
 
+import asyncio
 import json
-import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
-
-import anthropic
 
 from benchmarks.config import RELAY_BASE_URL, RELAY_API_KEY, JUDGE_MODEL, JUDGE_MODELS, TaskResult
 
@@ -38,16 +35,31 @@ Respond with ONLY a JSON object:
 """
 
 
-def _judge_with_model(model: str, question: str, reference: str, candidate: str) -> tuple[float | None, str]:
+# Shared async client so concurrent judgments reuse one connection pool
+# instead of reconnecting to the relay per call. The anthropic import is
+# deferred to first use so importing this module stays cheap.
+_CLIENT = None
+
+
+def _get_client():
+    global _CLIENT
+    if _CLIENT is None:
+        import anthropic
+
+        _CLIENT = anthropic.AsyncAnthropic(base_url=RELAY_BASE_URL, api_key=RELAY_API_KEY)
+    return _CLIENT
+
+
+async def _judge_with_model(model: str, question: str, reference: str, candidate: str) -> tuple[float | None, str]:
     """Score using a single judge model. Returns (score, rationale)."""
-    client = anthropic.Anthropic(base_url=RELAY_BASE_URL, api_key=RELAY_API_KEY)
+    client = _get_client()
     user_msg = (
         f"## Question\n{question}\n\n"
         f"## Reference Answer (ground truth)\n{reference}\n\n"
         f"## Candidate Answer\n{candidate}\n"
     )
     try:
-        response = client.messages.create(
+        response = await client.messages.create(
             model=model,
             max_tokens=512,
             system=JUDGE_SYSTEM,
@@ -62,7 +74,7 @@ def _judge_with_model(model: str, question: str, reference: str, candidate: str)
         return None, f"Judge error: {type(e).__name__}: {e}"
 
 
-def judge_answer(question: str, reference: str, candidate: str, judge_models: list[str] | None = None) -> tuple[float, str]:
+async def judge_answer(question: str, reference: str, candidate: str, judge_models: list[str] | None = None) -> tuple[float, str]:
     """Score a candidate answer using an ensemble of judge models.
 
     Runs each judge model independently and returns the mean score.
@@ -71,10 +83,18 @@ def judge_answer(question: str, reference: str, candidate: str, judge_models: li
     if judge_models is None:
         judge_models = JUDGE_MODELS
 
+    # Each judge call is an independent network-bound request; run the
+    # ensemble concurrently so judging one answer costs ~one call's latency.
+    if len(judge_models) == 1:
+        judgments = [await _judge_with_model(judge_models[0], question, reference, candidate)]
+    else:
+        judgments = await asyncio.gather(
+            *(_judge_with_model(m, question, reference, candidate) for m in judge_models)
+        )
+
     scores = []
     rationales = []
-    for model in judge_models:
-        score, rationale = _judge_with_model(model, question, reference, candidate)
+    for model, (score, rationale) in zip(judge_models, judgments):
         if score is not None:
             scores.append(score)
             rationales.append(f"[{model}:{score:.2f}] {rationale}")
@@ -86,20 +106,21 @@ def judge_answer(question: str, reference: str, candidate: str, judge_models: li
     return mean_score, " | ".join(rationales)
 
 
-def evaluate_results(
+async def evaluate_results_async(
     results: list[TaskResult],
     questions: dict[str, str],
     references: dict[str, str],
     verbose: bool = False,
     checkpoint_path: str | None = None,
     checkpoint_every: int = 50,
-    max_workers: int = 3,
+    max_concurrency: int = 3,
 ) -> list[TaskResult]:
     """Run the judge on all results and populate correctness fields.
 
-    Judgments run in parallel (max_workers threads). Each judgment calls all
-    JUDGE_MODELS sequentially inside judge_answer, but multiple results are
-    judged concurrently, cutting total time by ~max_workers.
+    Judgments run concurrently on the event loop, gated by a Semaphore of
+    max_concurrency in-flight judgments (each of which fans out to all
+    JUDGE_MODELS at once), cutting total time from sum to roughly
+    max-of-latencies per batch.
 
     Args:
         results: TaskResults with final_answer populated.
@@ -107,12 +128,11 @@ def evaluate_results(
         references: task_id -> reference answer string.
         checkpoint_path: if set, save progress every `checkpoint_every` completions.
         checkpoint_every: how often to checkpoint (default: 50).
-        max_workers: parallel judgment threads (default: 16).
+        max_concurrency: concurrent in-flight judgments (default: 3).
 
     Returns the same results list with correctness_score/rationale filled in.
     """
-    _lock = threading.Lock()
-    completed = [0]
+    completed = 0
 
     # Pre-score errors (no API call needed)
     pending = []
@@ -129,31 +149,51 @@ def evaluate_results(
     if verbose and already_done:
         print(f"  {already_done} already scored or errored, judging {len(pending)} remaining")
 
-    def _judge_one(r: TaskResult) -> None:
+    sem = asyncio.Semaphore(max_concurrency)
+
+    async def _judge_one(r: TaskResult) -> None:
+        nonlocal completed
         question = questions.get(r.task_id, "")
         reference = references.get(r.task_id, "")
-        score, rationale = judge_answer(question, reference, r.final_answer)
+        async with sem:
+            score, rationale = await judge_answer(question, reference, r.final_answer)
         r.correctness_score = score
         r.correctness_rationale = rationale
 
-        with _lock:
-            completed[0] += 1
-            n = completed[0]
+        # Single-threaded event loop: no lock needed around the counter or
+        # the checkpoint write.
+        completed += 1
+        n = completed
+        if verbose:
+            tag = f"{r.approach}/{r.model}/{r.task_id}/t{r.trial}"
+            print(f"  [{n}/{len(pending)}] {tag}: {score} — {rationale[:60]}", flush=True)
+        if checkpoint_path and n % checkpoint_every == 0:
+            from dataclasses import asdict
+            from pathlib import Path
+            Path(checkpoint_path).write_text(
+                json.dumps([asdict(r2) for r2 in results], indent=2, default=str)
+            )
             if verbose:
-                tag = f"{r.approach}/{r.model}/{r.task_id}/t{r.trial}"
-                print(f"  [{n}/{len(pending)}] {tag}: {score} — {rationale[:60]}", flush=True)
-            if checkpoint_path and n % checkpoint_every == 0:
-                from dataclasses import asdict
-                from pathlib import Path
-                Path(checkpoint_path).write_text(
-                    json.dumps([asdict(r2) for r2 in results], indent=2, default=str)
-                )
-                if verbose:
-                    print(f"  [checkpoint at {n}/{len(pending)}]", flush=True)
-
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = [executor.submit(_judge_one, r) for r in pending]
-        for f in as_completed(futures):
-            f.result()  # re-raise any exception
+                print(f"  [checkpoint at {n}/{len(pending)}]", flush=True)
 
+    await asyncio.gather(*(_judge_one(r) for r in pending))
     return results
+
+
+def evaluate_results(
+    results: list[TaskResult],
+    questions: dict[str, str],
+    references: dict[str, str],
+    verbose: bool = False,
+    checkpoint_path: str | None = None,
+    checkpoint_every: int = 50,
+    max_workers: int = 3,
+) -> list[TaskResult]:
+    """Synchronous wrapper: drive evaluate_results_async on a fresh loop."""
+    return asyncio.run(evaluate_results_async(
+        results, questions, references,
+        verbose=verbose,
+        checkpoint_path=checkpoint_path,
+        checkpoint_every=checkpoint_every,
+        max_concurrency=max_workers,
+    ))
@@ -18,10 +18,15 @@ from pathlib import Path
 APPROACH_ORDER = ["mcp_direct", "skill", "cf_code_mode", "code_mode"]
 MODEL_ORDER = ["haiku", "sonnet", "opus"]
 
+# Rank dicts precomputed once: sort_key runs per comparison, and list.index
+# is an O(n) scan each time it's called.
+_APPROACH_RANK = {name: i for i, name in enumerate(APPROACH_ORDER)}
+_MODEL_RANK = {name: i for i, name in enumerate(MODEL_ORDER)}
+
 
 def sort_key(r: dict) -> tuple:
-    a = APPROACH_ORDER.index(r["approach"]) if r["approach"] in APPROACH_ORDER else 99
-    m = MODEL_ORDER.index(r["model"]) if r["model"] in MODEL_ORDER else 99
+    a = _APPROACH_RANK.get(r["approach"], 99)
+    m = _MODEL_RANK.get(r["model"], 99)
     return (a, m, r.get("task_id", ""))
 
 
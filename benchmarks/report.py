@@ -1,8 +1,10 @@
 """JSON output and tabulate summary tables."""
 
+import csv
 import json
 import math
 import statistics
+import sys
 from collections import defaultdict
 from dataclasses import asdict
 from pathlib import Path
@@ -13,14 +15,28 @@ from benchmarks.config import TaskResult
 
 
 def save_results(results: list[TaskResult], output_path: str) -> None:
-    """Write all results to a JSON file."""
+    """Write all results to a JSON file.
+
+    Streams with json.dump instead of materializing the full serialized
+    string in memory first.
+    """
     data = [asdict(r) for r in results]
-    Path(output_path).write_text(json.dumps(data, indent=2, default=str))
+    with open(output_path, "w") as f:
+        json.dump(data, f, indent=2, default=str)
     print(f"\nResults saved to {output_path}")
 
 
+# Above this many rows, tabulate's column-width measurement is slower than the
+# table is useful; fall back to plain TSV output instead.
+_TABULATE_ROW_LIMIT = 1000
+
+
 def print_summary_table(results: list[TaskResult]) -> None:
-    """Print per-task detail table."""
+    """Print per-task detail table.
+
+    Very large result sets (> _TABULATE_ROW_LIMIT rows) are emitted as TSV
+    via csv.writer rather than padded through tabulate.
+    """
     headers = [
         "Approach", "Model", "Task", "In Tok", "Out Tok", "Total Tok",
         "Time(s)", "Cost($)", "Score", "Error",
@@ -43,7 +59,12 @@ def print_summary_table(results: list[TaskResult]) -> None:
     print("\n" + "=" * 110)
     print("DETAILED RESULTS")
     print("=" * 110)
-    print(tabulate(rows, headers=headers, tablefmt="simple"))
+    if len(rows) > _TABULATE_ROW_LIMIT:
+        writer = csv.writer(sys.stdout, delimiter="\t", lineterminator="\n")
+        writer.writerow(headers)
+        writer.writerows(rows)
+    else:
+        print(tabulate(rows, headers=headers, tablefmt="simple"))
 
 
 def _stats(values: list[float]) -> dict:
@@ -58,33 +79,34 @@ def _stats(values: list[float]) -> dict:
     }
 
 
-def _cell_scores(results: list[TaskResult]) -> dict[tuple[str, str, str], float]:
-    """Average correctness scores across trials per (approach, model, task) cell.
+def _cell_aggregates(
+    results: list[TaskResult],
+) -> tuple[
+    dict[tuple[str, str, str], float],
+    dict[tuple[str, str, str], float],
+    dict[tuple[str, str, str], float],
+]:
+    """Average scores, costs, and tokens per (approach, model, task) cell in one pass.
 
-    With multiple trials per cell, this collapses them to one representative score
-    before any statistical analysis. Single-trial results (trial=0 only) are unchanged.
+    With multiple trials per cell, this collapses them to one representative value
+    before any statistical analysis. Single-trial results (trial=0 only) are
+    unchanged. Returns (scores, costs, tokens) maps; cells with no scored trials
+    are absent from the scores map.
     """
-    raw: dict[tuple[str, str, str], list[float]] = defaultdict(list)
+    raw_scores: dict[tuple[str, str, str], list[float]] = defaultdict(list)
+    raw_costs: dict[tuple[str, str, str], list[float]] = defaultdict(list)
+    raw_tokens: dict[tuple[str, str, str], list[float]] = defaultdict(list)
     for r in results:
+        key = (r.approach, r.model, r.task_id)
         if r.correctness_score is not None:
-            raw[(r.approach, r.model, r.task_id)].append(r.correctness_score)
-    return {k: sum(v) / len(v) for k, v in raw.items()}
-
-
-def _cell_costs(results: list[TaskResult]) -> dict[tuple[str, str, str], float]:
-    """Average cost per trial per (approach, model, task) cell."""
-    raw: dict[tuple[str, str, str], list[float]] = defaultdict(list)
-    for r in results:
-        raw[(r.approach, r.model, r.task_id)].append(r.estimated_cost_usd)
-    return {k: sum(v) / len(v) for k, v in raw.items()}
-
-
-def _cell_tokens(results: list[TaskResult]) -> dict[tuple[str, str, str], float]:
-    """Average total tokens per trial per (approach, model, task) cell."""
-    raw: dict[tuple[str, str, str], list[float]] = defaultdict(list)
-    for r in results:
-        raw[(r.approach, r.model, r.task_id)].append(r.total_tokens)
-    return {k: sum(v) / len(v) for k, v in raw.items()}
+            raw_scores[key].append(r.correctness_score)
+        raw_costs[key].append(r.estimated_cost_usd)
+        raw_tokens[key].append(r.total_tokens)
+    return (
+        {k: sum(v) / len(v) for k, v in raw_scores.items()},
+        {k: sum(v) / len(v) for k, v in raw_costs.items()},
+        {k: sum(v) / len(v) for k, v in raw_tokens.items()},
+    )
 
 
 def print_category_table(results: list[TaskResult], tasks_by_id: dict) -> None:
@@ -92,8 +114,7 @@ def print_category_table(results: list[TaskResult], tasks_by_id: dict) -> None:
 
     Scores are averaged across trials per cell before aggregating by category.
     """
-    scores_map = _cell_scores(results)
-    costs_map = _cell_costs(results)
+    scores_map, costs_map, _ = _cell_aggregates(results)
 
     # (approach, category) → list of task-level cell scores (already trial-averaged)
     groups: dict[tuple[str, str], list[float]] = defaultdict(list)
@@ -158,9 +179,7 @@ def print_aggregate_table(results: list[TaskResult]) -> None:
     Statistics are computed over task-level means (trials averaged per cell),
     so each row represents n=tasks data points regardless of trial count.
     """
-    scores_map = _cell_scores(results)
-    costs_map = _cell_costs(results)
-    tokens_map = _cell_tokens(results)
+    scores_map, costs_map, tokens_map = _cell_aggregates(results)
 
     # Group cell-level data by (approach, model)
     score_groups: dict[tuple[str, str], list[float]] = defaultdict(list)
@@ -229,7 +248,7 @@ def print_significance_table(results: list[TaskResult]) -> None:
         return
 
     # Step 1: trial-average per (approach, model, task)
-    scores_map = _cell_scores(results)
+    scores_map, _, _ = _cell_aggregates(results)
 
     # Step 2: average across models per (approach, task)
     cell: dict[tuple[str, str], list[float]] = defaultdict(list)
@@ -1,28 +1,26 @@
 """CLI entry point and orchestrator for the benchmark suite."""
 
 import argparse
+import asyncio
 import json
 import sys
-import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import asdict, fields
 from pathlib import Path
 
 from benchmarks.config import MODELS, RELAY_BASE_URL, TaskResult
 from benchmarks.discover import discover_flows, build_test_context
-from benchmarks.tasks import build_tasks, render_prompt, BenchmarkTask
+from benchmarks.tasks import build_tasks, compute_reference, render_prompt, BenchmarkTask
 from benchmarks.approaches import APPROACHES
 from benchmarks.harness import run_task
 from benchmarks.judge import evaluate_results
 from benchmarks.report import save_results, print_summary_table, print_aggregate_table, print_category_table, print_significance_table
 
-# Thread-safe print
-_print_lock = threading.Lock()
-
-
 def _tprint(*args, **kwargs):
-    with _print_lock:
-        print(*args, **kwargs, flush=True)
+    # All progress output comes from the single event-loop thread (the
+    # reference pool's workers never print), so no lock or printer queue
+    # is needed around stdout.
+    print(*args, **kwargs, flush=True)
 
 
 def parse_args() -> argparse.Namespace:
@@ -79,54 +77,83 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Skip Phase 1-3; load raw results from RAW_FILE, judge, and write --output",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Recompute reference answers instead of using benchmarks/.cache/",
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
         help="Print detailed progress",
     )
     parser.add_argument(
-        "--workers",
+        "--relay-concurrency",
         type=int,
-        default=4,
-        help="Max parallel workers (default: 4, to avoid relay 503s)",
+        default=8,
+        help="Max in-flight relay requests (default: 8, to avoid relay 503s)",
     )
     return parser.parse_args()
 
 
-def _run_worker(
+async def _run_one(
     approach,
     model_name: str,
     model_id: str,
-    tasks: list,
-    questions: dict[str, str],
+    task_id: str,
+    prompt: str,
+    trial: int,
     num_trials: int,
     verbose: bool,
-) -> list[TaskResult]:
-    """Run all tasks × trials for one (approach, model) combo. Called in a thread."""
-    worker_results = []
+    sem: asyncio.Semaphore,
+) -> TaskResult:
+    """Run one (approach, model, task, trial) cell as a coroutine.
+
+    Each cell is an independent relay call, so scheduling them individually
+    avoids head-of-line blocking: one stalled call no longer delays the rest
+    of its combo. `sem` caps total in-flight relay requests.
+    """
     tag = f"{approach.name}/{model_name}"
-    for task in tasks:
-        prompt = questions[task.id]
-        for trial in range(num_trials):
-            trial_tag = f"trial {trial + 1}/{num_trials}" if num_trials > 1 else ""
-            _tprint(f"  [{tag}] {task.id} {trial_tag}...")
-            result = run_task(
-                approach=approach,
-                model_id=model_id,
-                model_name=model_name,
-                task_id=task.id,
-                user_prompt=prompt,
-                verbose=verbose,
-            )
-            result.trial = trial
-            worker_results.append(result)
-            _tprint(
-                f"  [{tag}] {task.id} t{trial} -> "
-                f"{result.total_tokens} tok, {result.wall_clock_seconds}s, "
-                f"${result.estimated_cost_usd:.4f}"
-                + (f" ERROR: {result.error}" if result.error else "")
-            )
-    return worker_results
+    trial_tag = f" trial {trial + 1}/{num_trials}" if num_trials > 1 else ""
+    async with sem:
+        _tprint(f"  [{tag}] {task_id}{trial_tag}...")
+        result = await run_task(
+            approach=approach,
+            model_id=model_id,
+            model_name=model_name,
+            task_id=task_id,
+            user_prompt=prompt,
+            verbose=verbose,
+        )
+    result.trial = trial
+    _tprint(
+        f"  [{tag}] {task_id} t{trial} -> "
+        f"{result.total_tokens} tok, {result.wall_clock_seconds}s, "
+        f"${result.estimated_cost_usd:.4f}"
+        + (f" ERROR: {result.error}" if result.error else "")
+    )
+    return result
+
+
+def _compute_references(tasks: list, ctx, use_cache: bool, warn: bool = False) -> dict[str, str]:
+    """Compute reference answers for all tasks concurrently.
+
+    Each reference_fn is an independent, network-bound Metaflow client call,
+    so the phase runs in a thread pool: wall time drops from the sum of the
+    per-task latencies to roughly the slowest one.
+    """
+    references: dict[str, str] = {}
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = {executor.submit(compute_reference, t, ctx, use_cache): t for t in tasks}
+        for future in as_completed(futures):
+            task = futures[future]
+            try:
+                references[task.id] = future.result()
+            except Exception as e:
+                if warn:
+                    print(f"  WARNING: reference_fn failed for {task.id}: {e}")
+                references[task.id] = f"(reference error: {e})"
+    return references
 
 
 def _load_raw_results(path: str) -> list[TaskResult]:
@@ -162,16 +189,9 @@ def main():
         flows = discover_flows(only_flows=args.only_flows)
         ctx = build_test_context(flows)
         all_tasks = build_tasks(ctx)
-        questions: dict[str, str] = {}
-        references: dict[str, str] = {}
-        for task in all_tasks:
-            if task.skip_reason is not None:
-                continue
-            questions[task.id] = render_prompt(task, ctx)
-            try:
-                references[task.id] = task.reference_fn(ctx)
-            except Exception as e:
-                references[task.id] = f"(reference error: {e})"
+        judgeable = [t for t in all_tasks if t.skip_reason is None]
+        questions = {t.id: render_prompt(t, ctx) for t in judgeable}
+        references = _compute_references(judgeable, ctx, use_cache=not args.no_cache)
 
         checkpoint_path = args.output.replace(".json", ".checkpoint.json")
         print(f"\nPhase 4: Judging correctness ({len(results)} results)...")
@@ -222,52 +242,65 @@ def main():
         sys.exit(1)
 
     # Compute reference answers and prompts
-    questions: dict[str, str] = {}
-    references: dict[str, str] = {}
-    for task in runnable:
-        prompt = render_prompt(task, ctx)
-        questions[task.id] = prompt
-        try:
-            references[task.id] = task.reference_fn(ctx)
-        except Exception as e:
-            print(f"  WARNING: reference_fn failed for {task.id}: {e}")
-            references[task.id] = f"(reference error: {e})"
-
-    # Phase 3: Run benchmarks in parallel (one thread per approach/model combo)
+    questions = {t.id: render_prompt(t, ctx) for t in runnable}
+    references = _compute_references(runnable, ctx, use_cache=not args.no_cache, warn=True)
+
+    # Write the tool-schema cache once so runtime Python snippets (CF Code
+    # Mode's search phase) load schemas from disk instead of re-introspecting
+    # the server module in every subprocess. The snippets run on the relay
+    # side, so the CF Code Mode prompt injects METAFLOW_MCP_SCHEMA_CACHE into
+    # its uv run commands (an env var set here would never reach them); this
+    # write only helps when the relay shares this checkout, and the server
+    # falls back to introspection when the file is absent.
+    from benchmarks.api_docs import dump_api_schema_cache
+    dump_api_schema_cache(str(Path(args.output).with_name("schema_cache.json")))
+
+    # Phase 3: Run benchmarks concurrently (one coroutine per approach/model
+    # combo on a single event loop; no thread per combo)
     approach_instances = {name: cls() for name, cls in APPROACHES.items() if name in args.approaches}
-    num_workers = len(approach_instances) * len(args.models)
-    if args.workers is not None:
-        num_workers = min(num_workers, args.workers)
     total_tasks = len(approach_instances) * len(args.models) * len(runnable) * args.trials
-    print(f"\nPhase 3: Running benchmarks ({num_workers} workers x {len(runnable)} tasks x {args.trials} trials = {total_tasks} total)...")
+    print(f"\nPhase 3: Running benchmarks ({args.relay_concurrency} in-flight x {len(runnable)} tasks x {args.trials} trials = {total_tasks} total)...")
 
     results: list[TaskResult] = []
-    with ThreadPoolExecutor(max_workers=num_workers) as executor:
-        futures = {}
-        for approach_name, approach in approach_instances.items():
-            for model_name in args.models:
-                model_id = MODELS[model_name]
-                future = executor.submit(
-                    _run_worker,
-                    approach, model_name, model_id,
-                    runnable, questions, args.trials, args.verbose,
-                )
-                futures[future] = f"{approach_name}/{model_name}"
 
-        for future in as_completed(futures):
-            tag = futures[future]
+    async def _drive() -> None:
+        # Concurrency policy is the relay's throughput, not the fan-out:
+        # every cell is scheduled, but only --relay-concurrency requests
+        # are in flight at once.
+        sem = asyncio.Semaphore(args.relay_concurrency)
+        coros = []
+        tags = []
+        for approach in approach_instances.values():
+            for model_name in args.models:
+                for task in runnable:
+                    for trial in range(args.trials):
+                        coros.append(_run_one(
+                            approach, model_name, MODELS[model_name],
+                            task.id, questions[task.id],
+                            trial, args.trials, args.verbose, sem,
+                        ))
+                        tags.append(f"{approach.name}/{model_name}/{task.id}/t{trial}")
+
+        # Single work item (e.g. --tasks X --trials 1 with one combo): await
+        # it directly rather than spinning up the gather machinery for one
+        # coroutine.
+        if len(coros) == 1:
             try:
-                worker_results = future.result()
-                results.extend(worker_results)
-                _tprint(f"  [{tag}] DONE ({len(worker_results)} tasks)")
+                results.append(await coros[0])
             except Exception as e:
-                _tprint(f"  [{tag}] FAILED: {e}")
-
-    # Sort results for consistent output: approach, model, task order
-    task_order = {t.id: i for i, t in enumerate(runnable)}
-    approach_order = {n: i for i, n in enumerate(APPROACHES.keys())}
-    model_order = {n: i for i, n in enumerate(MODELS.keys())}
-    results.sort(key=lambda r: (approach_order.get(r.approach, 99), model_order.get(r.model, 99), task_order.get(r.task_id, 99)))
+                _tprint(f"  [{tags[0]}] FAILED: {e}")
+            return
+
+        for tag, outcome in zip(tags, await asyncio.gather(*coros, return_exceptions=True)):
+            if isinstance(outcome, BaseException):
+                _tprint(f"  [{tag}] FAILED: {outcome}")
+            else:
+                results.append(outcome)
+
+    # The work list is built in (approach, model, task, trial) order and
+    # asyncio.gather returns outcomes in submission order, so `results` is
+    # already in canonical order — no O(N log N) sort pass needed.
+    asyncio.run(_drive())
 
     # Save raw results (no scores yet) so judging can be re-run if it crashes
     raw_path = args.output.replace(".json", ".raw.json")
@@ -1,13 +1,50 @@
 """10 benchmark task definitions with reference answer functions."""
 
+import hashlib
 import json
-from dataclasses import dataclass
+import reprlib
+import string
+from dataclasses import dataclass, replace
+from itertools import islice
+from pathlib import Path
 from typing import Callable, Optional
 
+from metaflow import Flow, Metaflow, Run, Task
+from metaflow.client import get_metadata
+from metaflow.metaflow_config import DEFAULT_DATASTORE
+
 from benchmarks.discover import TestContext
 
 
-@dataclass
+# Reference answers hit the Metaflow client (network + datastore) and
+# dominate Phase 2; for a fixed discovered context they are stable, so
+# results are memoized to disk and re-runs load them instead.
+_REF_CACHE_DIR = Path(__file__).parent / ".cache"
+
+# Bounded repr for artifact payloads: plain repr() materializes the full
+# string (think gigabyte-scale arrays or frames) before any slicing can
+# happen; reprlib truncates while building.
+_short_repr = reprlib.Repr()
+_short_repr.maxstring = 200
+_short_repr.maxlist = 10
+_short_repr.maxdict = 10
+_short_repr.maxother = 200
+
+
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        """Serialize via orjson: C-accelerated, datetimes handled natively."""
+        return orjson.dumps(obj, default=str).decode()
+
+except ImportError:  # orjson is an optional speedup, not a hard dependency
+
+    def _dumps(obj) -> str:
+        return json.dumps(obj, default=str)
+
+
+@dataclass(slots=True, frozen=True)
 class BenchmarkTask:
     """A single benchmark task definition."""
 
@@ -16,34 +53,32 @@ class BenchmarkTask:
     prompt_template: str  # may contain {flow_name}, {run}, etc.
     reference_fn: Callable[[TestContext], str]
     skip_reason: Optional[str] = None  # set if context is insufficient
+    # Precompiled renderer set by build_tasks; render_prompt falls back to
+    # str.format when absent (e.g. hand-built tasks in tests).
+    _render: Optional[Callable[[TestContext], str]] = None
 
 
 def _ref_simple_config(ctx: TestContext) -> str:
-    from metaflow.client import get_metadata
-    from metaflow.metaflow_config import DEFAULT_DATASTORE
-    return json.dumps({
+    return _dumps({
         "metadata_provider": get_metadata(),
         "default_datastore": DEFAULT_DATASTORE,
     })
 
 
 def _ref_simple_list_runs(ctx: TestContext) -> str:
-    from metaflow import Flow
     flow = Flow(ctx.flow_name)
-    runs = []
-    for run in flow:
-        runs.append({
+    runs = [
+        {
             "pathspec": run.pathspec,
             "successful": run.successful,
             "finished": run.finished,
-        })
-        if len(runs) >= 3:
-            break
-    return json.dumps(runs, default=str)
+        }
+        for run in islice(flow, 3)
+    ]
+    return _dumps(runs)
 
 
 def _ref_medium_run_details(ctx: TestContext) -> str:
-    from metaflow import Run
     run = Run(ctx.run_pathspec)
     steps = []
     for step in run:
@@ -51,135 +86,176 @@ def _ref_medium_run_details(ctx: TestContext) -> str:
         for task in step:
             tasks.append({"id": task.id, "successful": task.successful})
         steps.append({"step": step.id, "tasks": tasks})
-    return json.dumps({"pathspec": run.pathspec, "successful": run.successful, "steps": steps}, default=str)
+    return _dumps({"pathspec": run.pathspec, "successful": run.successful, "steps": steps})
+
+
+def _head_log(task, stream: str, n: int = 500) -> str:
+    """First `n` characters of a task's log without fetching the whole thing.
+
+    task.loglines yields one line at a time from the datastore, so huge CI
+    logs stop downloading once the budget is met. Falls back to the plain
+    stdout/stderr property on clients without loglines.
+    """
+    try:
+        buf = []
+        size = 0
+        for _, line in task.loglines(stream):
+            buf.append(line)
+            size += len(line)
+            if size >= n:
+                break
+        return "\n".join(buf)[:n]
+    except AttributeError:
+        return (getattr(task, stream) or "")[:n]
 
 
 def _ref_medium_task_logs(ctx: TestContext) -> str:
-    from metaflow import Task
     task = Task(ctx.task_pathspec)
-    return json.dumps({
+    return _dumps({
         "pathspec": ctx.task_pathspec,
-        "stdout": (task.stdout or "")[:500],
-        "stderr": (task.stderr or "")[:500],
+        "stdout": _head_log(task, "stdout"),
+        "stderr": _head_log(task, "stderr"),
     })
 
 
 def _ref_medium_artifact_inspect(ctx: TestContext) -> str:
-    from metaflow import Task
     task = Task(ctx.task_pathspec)
     artifacts = [{"name": a.id, "type": type(a.data).__name__} for a in task]
-    value = repr(task[ctx.artifact_name].data) if ctx.artifact_name else "N/A"
-    return json.dumps({"artifacts": artifacts, "artifact_value": value[:500]}, default=str)
+    value = _short_repr.repr(task[ctx.artifact_name].data) if ctx.artifact_name else "N/A"
+    return _dumps({"artifacts": artifacts, "artifact_value": value[:500]})
 
 
 def _ref_complex_latest_failure(ctx: TestContext) -> str:
-    from metaflow import Flow
     flow = Flow(ctx.failed_flow_name)
     for run in flow:
         if run.finished and not run.successful:
             for step in run:
                 for task in step:
                     if task.finished and not task.successful:
-                        return json.dumps({
+                        return _dumps({
                             "run": run.pathspec,
                             "failing_step": step.id,
                             "exception": repr(task.exception) if task.exception else None,
-                        }, default=str)
-            return json.dumps({"run": run.pathspec, "note": "failed but no failing task found"})
-    return json.dumps({"message": "no failed runs found"})
+                        })
+            return _dumps({"run": run.pathspec, "note": "failed but no failing task found"})
+    return _dumps({"message": "no failed runs found"})
 
 
-def _ref_complex_success_rate(ctx: TestContext) -> str:
-    from metaflow import Flow
-    flow = Flow(ctx.flow_name)
-    runs = []
-    for run in flow:
-        runs.append(run)
-        if len(runs) >= 10:
-            break
-    finished = [r for r in runs if r.finished]
-    successful = [r for r in finished if r.successful]
-    rate = len(successful) / len(finished) if finished else 0.0
-    return json.dumps({
-        "flow": ctx.flow_name,
+# Per-flow run statistics shared by reference functions that would otherwise
+# re-walk the same 10 runs; each Run materialization is a metadata round-trip.
+_flow_stats_cache: dict[str, dict] = {}
+
+
+def _load_flow_stats(flow_name: str) -> dict:
+    """Collect run statistics for a flow's 10 most recent runs in one pass.
+
+    Cached per flow name so _ref_complex_success_rate and
+    _ref_complex_debug_flow share a single walk of the runs (and of the
+    failed run's steps for the latest error).
+    """
+    stats = _flow_stats_cache.get(flow_name)
+    if stats is not None:
+        return stats
+    flow = Flow(flow_name)
+    runs = list(islice(flow, 10))
+    # finished/successful are metadata-backed properties; snapshot each once
+    # per run instead of re-fetching across the three passes below
+    finished = [(r, r.successful) for r in runs if r.finished]
+    successful = sum(1 for _, ok in finished if ok)
+    rate = successful / len(finished) if finished else 0.0
+    latest_error = None
+    for run, ok in finished:
+        if not ok and latest_error is None:
+            for step in run:
+                for task in step:
+                    if task.finished and not task.successful and task.exception:
+                        latest_error = {
+                            "run": run.pathspec,
+                            "step": step.id,
+                            "exception": repr(task.exception),
+                        }
+                        break
+                if latest_error:
+                    break
+    stats = {
         "total_runs": len(runs),
         "total_finished": len(finished),
-        "successful": len(successful),
-        "success_rate": round(rate, 2),
+        "successful": successful,
+        "rate": rate,
+        "latest_error": latest_error,
+    }
+    _flow_stats_cache[flow_name] = stats
+    return stats
+
+
+def _ref_complex_success_rate(ctx: TestContext) -> str:
+    stats = _load_flow_stats(ctx.flow_name)
+    return _dumps({
+        "flow": ctx.flow_name,
+        "total_runs": stats["total_runs"],
+        "total_finished": stats["total_finished"],
+        "successful": stats["successful"],
+        "success_rate": round(stats["rate"], 2),
     })
 
 
 def _ref_complex_compare_runs(ctx: TestContext) -> str:
-    from metaflow import Flow
     flow = Flow(ctx.flow_name)
-    runs = []
-    for run in flow:
-        if run.finished:
-            runs.append(run)
-        if len(runs) >= 2:
-            break
+    runs = list(islice((r for r in flow if r.finished), 2))
     if len(runs) < 2:
-        return json.dumps({"error": "not enough finished runs to compare"})
+        return _dumps({"error": "not enough finished runs to compare"})
     comparison = []
     for run in runs:
         steps = [step.id for step in run]
         comparison.append({"pathspec": run.pathspec, "successful": run.successful, "steps": steps})
-    return json.dumps(comparison, default=str)
+    return _dumps(comparison)
 
 
 def _ref_complex_artifact_diff(ctx: TestContext) -> str:
-    from metaflow import Flow
     flow = Flow(ctx.flow_name)
-    successful_runs = []
-    for run in flow:
-        if run.finished and run.successful:
-            successful_runs.append(run)
-        if len(successful_runs) >= 2:
-            break
+    successful_runs = list(islice((r for r in flow if r.finished and r.successful), 2))
     if len(successful_runs) < 2:
-        return json.dumps({"error": "not enough successful runs"})
+        return _dumps({"error": "not enough successful runs"})
     results = []
     for run in successful_runs:
-        # Get artifacts from last step (by finished_at) first task
-        steps = list(run)
-        last_step = max(steps, key=lambda s: s.finished_at or "") if steps else None
+        # Get artifacts from last step (by finished_at) first task; max()
+        # streams the step iterator instead of materializing the full list
+        try:
+            last_step = max(run, key=lambda s: s.finished_at or "")
+        except ValueError:  # run has no steps
+            last_step = None
         if last_step:
             for task in last_step:
-                arts = {a.id: repr(a.data)[:200] for a in task if not a.id.startswith("_")}
+                arts = {a.id: _short_repr.repr(a.data) for a in task if not a.id.startswith("_")}
                 results.append({"run": run.pathspec, "step": last_step.id, "artifacts": arts})
                 break
-    return json.dumps(results, default=str)
+    return _dumps(results)
 
 
 def _ref_simple_list_flows(ctx: TestContext) -> str:
-    from metaflow import Metaflow
     flows = [flow.id for flow in Metaflow()]
-    return json.dumps({"flows": flows, "count": len(flows)})
+    return _dumps({"flows": flows, "count": len(flows)})
 
 
 def _ref_medium_filtered_runs(ctx: TestContext) -> str:
-    from metaflow import Flow
     flow = Flow(ctx.flow_name)
-    runs = []
-    for run in flow:
-        if run.successful:
-            runs.append({
-                "pathspec": run.pathspec,
-                "successful": True,
-                "created_at": str(run.created_at),
-            })
-        if len(runs) >= 3:
-            break
-    return json.dumps(runs, default=str)
+    runs = [
+        {
+            "pathspec": run.pathspec,
+            "successful": True,
+            "created_at": str(run.created_at),
+        }
+        for run in islice((r for r in flow if r.successful), 3)
+    ]
+    return _dumps(runs)
 
 
 def _ref_medium_bounded_logs(ctx: TestContext) -> str:
-    from metaflow import Task
     task = Task(ctx.task_pathspec)
     stderr = task.stderr or ""
     lines = stderr.splitlines()
     last_10 = lines[-10:] if len(lines) > 10 else lines
-    return json.dumps({
+    return _dumps({
         "pathspec": ctx.task_pathspec,
         "stderr_tail": "\n".join(last_10),
         "total_lines": len(lines),
@@ -187,7 +263,6 @@ def _ref_medium_bounded_logs(ctx: TestContext) -> str:
 
 
 def _ref_medium_run_timing(ctx: TestContext) -> str:
-    from metaflow import Run
     run = Run(ctx.run_pathspec)
     steps = []
     for step in run:
@@ -209,11 +284,10 @@ def _ref_medium_run_timing(ctx: TestContext) -> str:
                 "duration_seconds": dur,
             })
             break  # first task per step
-    return json.dumps({"pathspec": run.pathspec, "steps": steps}, default=str)
+    return _dumps({"pathspec": run.pathspec, "steps": steps})
 
 
 def _ref_complex_artifact_search(ctx: TestContext) -> str:
-    from metaflow import Flow
     flow = Flow(ctx.flow_name)
     results = []
     scanned = 0
@@ -231,11 +305,11 @@ def _ref_complex_artifact_search(ctx: TestContext) -> str:
                             "run": run.pathspec,
                         })
                         break
-    return json.dumps({
+    return _dumps({
         "artifact_name": ctx.artifact_name,
         "runs_scanned": scanned,
         "matches": results,
-    }, default=str)
+    })
 
 
 def _ref_disambig_count_run_states(ctx: TestContext) -> str:
@@ -245,13 +319,12 @@ def _ref_disambig_count_run_states(ctx: TestContext) -> str:
     identical to currently-running runs. There is no finished=True, successful=False
     state for local-backend exception failures. Models must use finished flag correctly.
     """
-    from metaflow import Flow
     flow = Flow(ctx.status_flow_name)
     all_runs = list(flow)
     unfinished = [r for r in all_runs if not r.finished]
     succeeded = [r for r in all_runs if r.finished and r.successful]
     failed = [r for r in all_runs if r.finished and not r.successful]
-    return json.dumps({
+    return _dumps({
         "flow": ctx.status_flow_name,
         "total_runs": len(all_runs),
         "unfinished_or_active": len(unfinished),
@@ -267,7 +340,6 @@ def _ref_disambig_most_recent_state(ctx: TestContext) -> str:
     API state as a currently-executing run. The correct answer is 'unfinished',
     not 'failed'.
     """
-    from metaflow import Flow
     flow = Flow(ctx.status_flow_name)
     run = next(iter(flow))  # iteration order = newest first
     if run.finished and run.successful:
@@ -276,7 +348,7 @@ def _ref_disambig_most_recent_state(ctx: TestContext) -> str:
         status = "finished_with_failure"
     else:
         status = "unfinished_or_active"
-    return json.dumps({
+    return _dumps({
         "run": run.pathspec,
         "finished": run.finished,
         "successful": run.successful,
@@ -291,17 +363,12 @@ def _ref_disambig_unfinished_not_failed(ctx: TestContext) -> str:
     checks only successful=False will count them as failures — this is wrong.
     The correct answer is: 2 unfinished, 3 succeeded, 0 failed.
     """
-    from metaflow import Flow
     flow = Flow(ctx.status_flow_name)
-    runs = []
-    for run in flow:
-        runs.append(run)
-        if len(runs) >= 5:
-            break
+    runs = list(islice(flow, 5))
     unfinished = [r.pathspec for r in runs if not r.finished]
     finished_ok = [r.pathspec for r in runs if r.finished and r.successful]
     finished_fail = [r.pathspec for r in runs if r.finished and not r.successful]
-    return json.dumps({
+    return _dumps({
         "flow": ctx.status_flow_name,
         "runs_examined": len(runs),
         "unfinished_or_active": len(unfinished),
@@ -316,13 +383,12 @@ def _ref_disambig_success_rate_finished_only(ctx: TestContext) -> str:
     If a model includes unfinished runs in the denominator, the success rate
     will be wrong. Correct: 4 finished, 4 successful → 100% success rate.
     """
-    from metaflow import Flow
     flow = Flow(ctx.status_flow_name)
     all_runs = list(flow)
     finished = [r for r in all_runs if r.finished]
     successful = [r for r in finished if r.successful]
     rate = round(len(successful) / len(finished), 2) if finished else 0.0
-    return json.dumps({
+    return _dumps({
         "flow": ctx.status_flow_name,
         "total_runs_all_states": len(all_runs),
         "total_finished": len(finished),
@@ -332,49 +398,23 @@ def _ref_disambig_success_rate_finished_only(ctx: TestContext) -> str:
 
 
 def _ref_complex_debug_flow(ctx: TestContext) -> str:
-    from metaflow import Flow
-    flow = Flow(ctx.flow_name)
-    runs = []
-    for run in flow:
-        runs.append(run)
-        if len(runs) >= 10:
-            break
-    finished = [r for r in runs if r.finished]
-    successful = [r for r in finished if r.successful]
-    rate = len(successful) / len(finished) if finished else 0.0
-    latest_error = None
-    for run in finished:
-        if not run.successful and latest_error is None:
-            for step in run:
-                for task in step:
-                    if task.finished and not task.successful and task.exception:
-                        latest_error = {
-                            "run": run.pathspec,
-                            "step": step.id,
-                            "exception": repr(task.exception),
-                        }
-                        break
-                if latest_error:
-                    break
-    return json.dumps({
+    stats = _load_flow_stats(ctx.flow_name)
+    return _dumps({
         "flow": ctx.flow_name,
-        "total_runs": len(runs),
-        "total_finished": len(finished),
-        "successful": len(successful),
-        "success_rate": round(rate, 2),
-        "latest_error": latest_error,
-    }, default=str)
+        "total_runs": stats["total_runs"],
+        "total_finished": stats["total_finished"],
+        "successful": stats["successful"],
+        "success_rate": round(stats["rate"], 2),
+        "latest_error": stats["latest_error"],
+    })
 
 
 def _ref_hard_slowest_step(ctx: TestContext) -> str:
     """2 most recent finished runs: which step was slowest (by first-task duration)?"""
-    from metaflow import Flow
     from datetime import timezone
     flow = Flow(ctx.flow_name)
     result = []
-    for run in flow:
-        if not run.finished:
-            continue
+    for run in islice((r for r in flow if r.finished), 2):
         steps_with_dur = []
         for step in run:
             for task in step:
@@ -400,21 +440,13 @@ def _ref_hard_slowest_step(ctx: TestContext) -> str:
             "slowest_step_duration_seconds": slowest["duration_seconds"] if slowest else None,
             "all_steps": steps_with_dur,
         })
-        if len(result) >= 2:
-            break
-    return json.dumps({"flow": ctx.flow_name, "runs": result}, default=str)
+    return _dumps({"flow": ctx.flow_name, "runs": result})
 
 
 def _ref_hard_artifact_timeline(ctx: TestContext) -> str:
     """Fetch an artifact from each of 3 recent successful runs, report oldest-first."""
-    from metaflow import Flow
     flow = Flow(ctx.flow_name)
-    successful_runs = []
-    for run in flow:
-        if run.finished and run.successful:
-            successful_runs.append(run)
-        if len(successful_runs) >= 3:
-            break
+    successful_runs = list(islice((r for r in flow if r.finished and r.successful), 3))
     # successful_runs is newest-first; reverse for chronological order
     values = []
     for run in reversed(successful_runs):
@@ -423,23 +455,22 @@ def _ref_hard_artifact_timeline(ctx: TestContext) -> str:
             for task in step:
                 for art in task:
                     if art.id == ctx.artifact_name:
-                        val = repr(art.data)[:200]
+                        val = _short_repr.repr(art.data)
                         break
                 if val is not None:
                     break
             if val is not None:
                 break
         values.append({"run_id": run.id, "value": val})
-    return json.dumps({
+    return _dumps({
         "flow": ctx.flow_name,
         "artifact": ctx.artifact_name,
         "values_oldest_first": values,
-    }, default=str)
+    })
 
 
 def _ref_hard_steps_per_flow(ctx: TestContext) -> str:
     """For each benchmark flow, count steps in its most recent run; report which has most."""
-    from metaflow import Flow
     flow_names = ctx.only_flows or []
     flows_data = []
     for flow_name in flow_names:
@@ -457,18 +488,17 @@ def _ref_hard_steps_per_flow(ctx: TestContext) -> str:
         except Exception:
             continue
     most_steps_flow = max(flows_data, key=lambda x: x["step_count"])["flow"] if flows_data else None
-    return json.dumps({
+    return _dumps({
         "flows": flows_data,
         "most_steps_flow": most_steps_flow,
-    }, default=str)
+    })
 
 
 def _ref_hard_run_census(ctx: TestContext) -> str:
     """Count ALL runs by state — traps models that use search_runs default (last_n=5)."""
-    from metaflow import Flow
     flow = Flow(ctx.flow_name)
     total, successful, unfinished, failed = 0, 0, 0, 0
-    for run in flow:
+    for run in islice(flow, 200):
         total += 1
         if run.finished and run.successful:
             successful += 1
@@ -476,9 +506,7 @@ def _ref_hard_run_census(ctx: TestContext) -> str:
             failed += 1
         else:
             unfinished += 1
-        if total >= 200:
-            break
-    return json.dumps({
+    return _dumps({
         "flow": ctx.flow_name,
         "total_runs": total,
         "finished_successful": successful,
@@ -489,13 +517,10 @@ def _ref_hard_run_census(ctx: TestContext) -> str:
 
 def _ref_hard_fastest_run(ctx: TestContext) -> str:
     """Fastest run (shortest total wall-clock) among last 5 successful — requires 5 get_run calls."""
-    from metaflow import Flow
     from datetime import timezone
     flow = Flow(ctx.flow_name)
     runs = []
-    for run in flow:
-        if not (run.finished and run.successful):
-            continue
+    for run in islice((r for r in flow if r.finished and r.successful), 5):
         dur = None
         if run.created_at and run.finished_at:
             s = run.created_at
@@ -506,15 +531,13 @@ def _ref_hard_fastest_run(ctx: TestContext) -> str:
                 e = e.replace(tzinfo=timezone.utc)
             dur = round((e - s).total_seconds(), 2)
         runs.append({"run_id": run.id, "duration_seconds": dur})
-        if len(runs) >= 5:
-            break
     if not runs:
-        return json.dumps({"error": "no successful runs found"})
+        return _dumps({"error": "no successful runs found"})
     valid = [r for r in runs if r["duration_seconds"] is not None]
     if not valid:
-        return json.dumps({"error": "no timing data"})
+        return _dumps({"error": "no timing data"})
     fastest = min(valid, key=lambda r: r["duration_seconds"])
-    return json.dumps({
+    return _dumps({
         "flow": ctx.flow_name,
         "fastest_run_id": fastest["run_id"],
         "fastest_duration_seconds": fastest["duration_seconds"],
@@ -525,14 +548,10 @@ def _ref_hard_fastest_run(ctx: TestContext) -> str:
 def _ref_hard_median_run_duration(ctx: TestContext) -> str:
     """Median total wall-clock duration across last 5 successful runs — requires computation."""
     import statistics
-    from metaflow import Flow
     from datetime import timezone
     flow = Flow(ctx.flow_name)
     durations = []
-    count = 0
-    for run in flow:
-        if not (run.finished and run.successful):
-            continue
+    for run in islice((r for r in flow if r.finished and r.successful), 5):
         if run.created_at and run.finished_at:
             s = run.created_at
             e = run.finished_at
@@ -541,12 +560,9 @@ def _ref_hard_median_run_duration(ctx: TestContext) -> str:
             if e.tzinfo is None:
                 e = e.replace(tzinfo=timezone.utc)
             durations.append(round((e - s).total_seconds(), 2))
-        count += 1
-        if count >= 5:
-            break
     if len(durations) < 2:
-        return json.dumps({"error": "insufficient data"})
-    return json.dumps({
+        return _dumps({"error": "insufficient data"})
+    return _dumps({
         "flow": ctx.flow_name,
         "runs_sampled": len(durations),
         "individual_durations_seconds": durations,
@@ -561,7 +577,6 @@ def _ref_hard_cross_flow_status(ctx: TestContext) -> str:
     logic correctly. Code models must implement the three-way classification
     for each flow — the exact logic that trips up code generation.
     """
-    from metaflow import Flow
     flow_names = ctx.only_flows or []
     results = []
     for flow_name in flow_names:
@@ -588,7 +603,7 @@ def _ref_hard_cross_flow_status(ctx: TestContext) -> str:
             })
         except Exception:
             continue
-    return json.dumps({"flows": results}, default=str)
+    return _dumps({"flows": results})
 
 
 def _ref_hard_slowest_across_runs(ctx: TestContext) -> str:
@@ -598,7 +613,6 @@ def _ref_hard_slowest_across_runs(ctx: TestContext) -> str:
     must compute durations for 3 runs × N steps, handle timezone, then find
     the global maximum. Off-by-one in timezone or None handling → wrong answer.
     """
-    from metaflow import Flow
     from datetime import timezone
     flow = Flow(ctx.flow_name)
     all_entries = []
@@ -628,14 +642,14 @@ def _ref_hard_slowest_across_runs(ctx: TestContext) -> str:
                 break  # first task per step
     valid = [e for e in all_entries if e["duration_seconds"] is not None]
     if not valid:
-        return json.dumps({"error": "no timing data"})
+        return _dumps({"error": "no timing data"})
     slowest = max(valid, key=lambda e: e["duration_seconds"])
-    return json.dumps({
+    return _dumps({
         "flow": ctx.flow_name,
         "runs_examined": run_count,
         "all_step_durations": all_entries,
         "slowest_overall": slowest,
-    }, default=str)
+    })
 
 
 def build_tasks(ctx: TestContext) -> list[BenchmarkTask]:
@@ -905,11 +919,72 @@ def build_tasks(ctx: TestContext) -> list[BenchmarkTask]:
             skip_reason=None if ctx.flow_name else "no flow discovered",
         ),
     ]
-    return tasks
+    # BenchmarkTask is frozen, so attach the precompiled renderers via replace
+    return [replace(t, _render=_compile_template(t.prompt_template)) for t in tasks]
+
+
+# Template placeholder -> context value, mirroring render_prompt's kwargs.
+_TEMPLATE_FIELDS: dict[str, Callable[[TestContext], str]] = {
+    "flow_name": lambda ctx: ctx.flow_name,
+    "run": lambda ctx: ctx.run_pathspec,
+    "task": lambda ctx: ctx.task_pathspec,
+    "step": lambda ctx: ctx.step_name,
+    "artifact": lambda ctx: ctx.artifact_name,
+    "failed_flow": lambda ctx: ctx.failed_flow_name,
+    "status_flow": lambda ctx: ctx.status_flow_name,
+    "only_flows": lambda ctx: ", ".join(ctx.only_flows) if ctx.only_flows else "all flows",
+}
+
+
+def _compile_template(template: str) -> Callable[[TestContext], str]:
+    """Pre-parse a prompt template into a renderer closure.
+
+    str.format re-parses the template on every call; parsing once with
+    string.Formatter leaves rendering as a join over literals and context
+    getters.
+    """
+    parts = [
+        (literal, _TEMPLATE_FIELDS[field] if field else None)
+        for literal, field, _, _ in string.Formatter().parse(template)
+    ]
+    return lambda ctx: "".join(
+        literal + (getter(ctx) if getter else "") for literal, getter in parts
+    )
+
+
+def compute_reference(task: BenchmarkTask, ctx: TestContext, use_cache: bool = True) -> str:
+    """Compute a task's reference answer, memoized on disk per context.
+
+    The cache key hashes the reference function's name plus every context
+    field the functions can depend on, so newly discovered runs, tasks, or
+    artifacts invalidate stale entries naturally. Pass use_cache=False
+    (--no-cache) to force recomputation.
+    """
+    if not use_cache:
+        return task.reference_fn(ctx)
+    key_src = "|".join([
+        task.reference_fn.__name__,
+        ctx.flow_name, ctx.run_pathspec, ctx.task_pathspec,
+        ctx.artifact_name, ctx.failed_flow_name, ctx.status_flow_name,
+        ",".join(ctx.only_flows or []),
+    ])
+    digest = hashlib.blake2b(key_src.encode(), digest_size=16).hexdigest()
+    cache_path = _REF_CACHE_DIR / f"{task.id}-{digest}.json"
+    if cache_path.exists():
+        try:
+            return json.loads(cache_path.read_text())["reference"]
+        except (OSError, ValueError, KeyError):
+            pass  # unreadable entry: recompute and overwrite
+    reference = task.reference_fn(ctx)
+    _REF_CACHE_DIR.mkdir(exist_ok=True)
+    cache_path.write_text(json.dumps({"task_id": task.id, "reference": reference}, indent=2))
+    return reference
 
 
 def render_prompt(task: BenchmarkTask, ctx: TestContext) -> str:
     """Fill in the prompt template with values from the test context."""
+    if task._render is not None:
+        return task._render(ctx)
     return task.prompt_template.format(
         flow_name=ctx.flow_name,
         run=ctx.run_pathspec,
@@ -15,29 +15,127 @@ Usage:
   python -m metaflow_mcp_server.server
 """
 
+import io
 import json
+import operator
 import re
 import traceback
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from datetime import datetime, timezone
-from functools import wraps
+from functools import cache, lru_cache, wraps
+from itertools import islice
 
 from mcp.server import FastMCP
 
 mcp = FastMCP("metaflow")
 
-# Set namespace to None so we can see all runs (not just the current user's).
-# This is important for querying production runs triggered by schedulers
-# like Maestro, Argo, or Step Functions, which run in different namespaces.
-from metaflow import namespace
 
-namespace(None)
+@cache
+def _init_metaflow():
+    """Import Metaflow and set the global namespace, once, lazily.
+
+    Importing metaflow loads plugins and reads ~/.metaflowconfig, which
+    costs seconds -- doing it on the first tool call instead of at module
+    import keeps MCP stdio cold start fast.
+
+    The namespace is set to None so we can see all runs (not just the
+    current user's). This is important for querying production runs
+    triggered by schedulers like Maestro, Argo, or Step Functions, which
+    run in different namespaces.
+    """
+    _mf().namespace(None)
+
+
+@cache
+def _mf():
+    """Return the metaflow module, imported once on first use.
+
+    Tool bodies call this instead of re-executing `from metaflow import
+    ...` per invocation, so the import machinery's sys.modules lookups
+    and name rebinding are paid a single time.
+    """
+    import metaflow
+
+    return metaflow
+
+
+@cache
+def _get_cards():
+    """Return metaflow.cards.get_cards, imported once on first use."""
+    from metaflow.cards import get_cards
+
+    return get_cards
 
 
 # ── Helpers ───────────────────────────────────────────────────
 
 
-def _json(obj):
-    return json.dumps(obj, indent=2, default=str)
+try:
+    import orjson
+
+    def _json(obj):
+        """Pretty-print a response via orjson: C-accelerated, no per-field
+        Python callback for datetimes on the happy path."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str).decode()
+
+    def _dumps_compact(obj) -> str:
+        return orjson.dumps(obj, default=str).decode()
+
+except ImportError:  # orjson is an optional speedup, not a hard dependency
+
+    def _json(obj):
+        return json.dumps(obj, indent=2, default=str)
+
+    def _dumps_compact(obj) -> str:
+        return json.dumps(obj, separators=(",", ":"), default=str)
+
+
+def _encode(obj, fmt):
+    """Encode a response dict as JSON (default) or base64-wrapped MessagePack.
+
+    MCP tool results are strings, so the msgpack frame is base64-wrapped in
+    a small JSON envelope tagged with an "_encoding" marker the client can
+    dispatch on. MessagePack keeps binary fields (raw logs, array buffers)
+    as bin frames instead of escaped JSON strings, which is substantially
+    smaller and faster to encode for large payloads.
+    """
+    if fmt == "msgpack":
+        try:
+            import msgpack
+        except ImportError:
+            return _json({"error": "msgpack is not installed; use format='json'"})
+        import base64
+
+        packed = msgpack.packb(obj, use_bin_type=True, default=str)
+        return _json(
+            {"_encoding": "msgpack+b64", "data": base64.b64encode(packed).decode()}
+        )
+    return _json(obj)
+
+
+def _ndjson(header: dict, records, footer: dict | None = None) -> str:
+    """Serialize a response as newline-delimited JSON.
+
+    Writes a compact header line (tagged with "streaming": true and a
+    "records" key naming the per-line record type), then one JSON object
+    per record as each is produced — so a generator of records is encoded
+    incrementally instead of materializing the whole response — and
+    finally a footer line carrying the record count. `footer` may be a
+    mutable dict that the record generator fills in (e.g. scan counters);
+    it is only read after the records are exhausted.
+    """
+    buf = io.StringIO()
+    buf.write(_dumps_compact({**header, "streaming": True}))
+    count = 0
+    for record in records:
+        count += 1
+        buf.write("\n")
+        buf.write(_dumps_compact(record))
+    buf.write("\n")
+    buf.write(_dumps_compact({**(footer or {}), "count": count}))
+    return buf.getvalue()
 
 
 def _handle_errors(fn):
@@ -46,6 +144,7 @@ def _handle_errors(fn):
     @wraps(fn)
     def wrapper(*args, **kwargs):
         try:
+            _init_metaflow()
             return fn(*args, **kwargs)
         except Exception as e:
             return _json(
@@ -59,6 +158,22 @@ def _handle_errors(fn):
     return wrapper
 
 
+# Status filters over snapshotted run properties, bound once per call
+# instead of re-dispatching a chain of string comparisons for every
+# scanned run. Unknown status values fall back to no filtering, matching
+# the old if/elif chain.
+_STATUS_PREDICATES = {
+    None: lambda successful, finished: True,
+    "successful": lambda successful, finished: successful,
+    "failed": lambda successful, finished: finished and not successful,
+    "running": lambda successful, finished: not finished,
+}
+
+# Sort sentinel for runs with no created_at, built once instead of
+# reconstructing datetime.min with a timezone inside every sort-key call.
+_EPOCH = datetime.min.replace(tzinfo=timezone.utc)
+
+
 def _parse_dt(s):
     """Parse an ISO datetime string, assuming UTC if no timezone is given."""
     dt = datetime.fromisoformat(s)
@@ -84,17 +199,184 @@ def _duration(start, end):
 
 
 def _filter_log(text, head=None, tail=None, pattern=None):
-    """Apply head/tail/pattern filters to log text."""
-    if not text:
-        return text
-    lines = text.splitlines(keepends=True)
-    if pattern:
-        lines = [l for l in lines if re.search(pattern, l)]
+    """Apply head/tail/pattern filters to log text in a single pass.
+
+    Accepts either a string or an iterable of lines. The pattern is
+    compiled once, a maxlen deque keeps only the last `tail` lines, and a
+    head limit stops iteration early -- so a multi-MB log is never
+    materialized as a second list of lines.
+    """
+    if text is None or isinstance(text, str):
+        if not text:
+            return text
+        if head is None and tail is None and pattern is None:
+            return text
+        lines = io.StringIO(text)
+    else:
+        lines = text
+    cre = re.compile(pattern) if pattern else None
+
     if tail is not None:
-        lines = lines[-tail:]
-    elif head is not None:
-        lines = lines[:head]
-    return "".join(lines)
+        kept = deque(maxlen=tail)
+        for line in lines:
+            if cre is None or cre.search(line):
+                kept.append(line)
+        return "".join(kept)
+
+    if head is not None:
+        if head <= 0:
+            return ""
+        kept = []
+        for line in lines:
+            if cre is None or cre.search(line):
+                kept.append(line)
+                if len(kept) >= head:
+                    break
+        return "".join(kept)
+
+    if cre is None:
+        return "".join(lines)
+    return "".join(line for line in lines if cre.search(line))
+
+
+# repr() of a large builtin container walks every element and can burn
+# seconds of CPU, stalling the single MCP stdio process for every other
+# tool call. get_artifact offloads only those to a small worker-process
+# pool so a stuck repr can be abandoned via timeout. Everything else is
+# repr'd inline: arrays, DataFrames, and most objects print cheap
+# truncated summaries, and shipping them to a worker would pickle the
+# entire value for far more than the repr costs.
+_MAX_REPR_BYTES = 64_000
+_OFFLOAD_MIN_ITEMS = 100_000
+_CPU_POOL = None
+
+
+def _safe_repr(v) -> str:
+    if isinstance(v, (str, bytes)):
+        v = v[:_MAX_REPR_BYTES]  # slice before repr escapes the whole thing
+    return repr(v)[:_MAX_REPR_BYTES]
+
+
+def _repr_offloaded(value) -> str:
+    global _CPU_POOL
+    if not (
+        isinstance(value, (list, tuple, set, frozenset, dict))
+        and len(value) >= _OFFLOAD_MIN_ITEMS
+    ):
+        return _safe_repr(value)
+    try:
+        if _CPU_POOL is None:
+            _CPU_POOL = ProcessPoolExecutor(max_workers=2)
+        return _CPU_POOL.submit(_safe_repr, value).result(timeout=5)
+    except FuturesTimeoutError:
+        # The stuck repr keeps running and its worker slot cannot be
+        # reclaimed, so discard the whole pool; the next call starts a
+        # fresh one instead of queueing behind wedged workers.
+        pool, _CPU_POOL = _CPU_POOL, None
+        pool.shutdown(wait=False)
+        return f"<repr timed out after 5s for {type(value).__name__}>"
+    except Exception:
+        # Unpicklable value or a broken pool: repr inline, still bounded.
+        return _safe_repr(value)
+
+
+def _tail_log(task, stream: str, n: int = 2000) -> str:
+    """Last `n` characters of a task's log without holding the whole thing.
+
+    task.loglines yields one line at a time from the datastore, so only a
+    rolling window of lines totalling ~n characters stays in memory
+    instead of the full (possibly hundreds of MB) log. Falls back to the
+    plain stdout/stderr property on clients without loglines.
+    """
+    try:
+        loglines = task.loglines
+    except AttributeError:
+        return (getattr(task, stream) or "")[-n:]
+    kept = deque()
+    size = 0
+    for _, line in loglines(stream):
+        kept.append(line)
+        size += len(line) + 1
+        while size > n and len(kept) > 1:
+            size -= len(kept.popleft()) + 1
+    return "\n".join(kept)[-n:]
+
+
+def _task_log(task, stream: str, head=None, tail=None, pattern=None):
+    """Fetch and filter one log stream for get_task_logs.
+
+    When a filter is set, lines are streamed from the client instead of
+    fetching the full text first, so a tail keeps only its deque window
+    and a head stops reading early.
+    """
+    if head is None and tail is None and pattern is None:
+        return getattr(task, stream)
+    try:
+        loglines = task.loglines
+    except AttributeError:
+        return _filter_log(getattr(task, stream), head=head, tail=tail, pattern=pattern)
+    lines = (line + "\n" for _, line in loglines(stream))
+    return _filter_log(lines, head=head, tail=tail, pattern=pattern)
+
+
+# ── Client-object cache ───────────────────────────────────────
+#
+# Constructing Flow/Run/Step/Task hits the metadata service every time, so
+# tool sequences like search_runs → get_run → get_task_logs re-fetch the
+# same objects repeatedly. Cache them with a coarse time bucket in the key,
+# which gives lru_cache a TTL: after _CACHE_TTL_SECONDS the bucket changes
+# and the entry is re-fetched, so in-progress runs never go stale for long.
+
+_CACHE_TTL_SECONDS = 30
+
+
+def _ttl_bucket() -> int:
+    import time
+
+    return int(time.time() // _CACHE_TTL_SECONDS)
+
+
+@lru_cache(maxsize=256)
+def _cached_flow(name, ns, bucket):
+    mf = _mf()
+    if ns:
+        mf.namespace(ns)
+    try:
+        return mf.Flow(name)
+    finally:
+        if ns:
+            mf.namespace(None)
+
+
+@lru_cache(maxsize=256)
+def _cached_run(pathspec, bucket):
+    return _mf().Run(pathspec)
+
+
+@lru_cache(maxsize=256)
+def _cached_step(pathspec, bucket):
+    return _mf().Step(pathspec)
+
+
+@lru_cache(maxsize=256)
+def _cached_task(pathspec, bucket):
+    return _mf().Task(pathspec)
+
+
+def _flow(name, ns=None):
+    return _cached_flow(name, ns, _ttl_bucket())
+
+
+def _run(pathspec):
+    return _cached_run(pathspec, _ttl_bucket())
+
+
+def _step(pathspec):
+    return _cached_step(pathspec, _ttl_bucket())
+
+
+def _task(pathspec):
+    return _cached_task(pathspec, _ttl_bucket())
 
 
 def _extract_text_from_html(html: str) -> str:
@@ -128,18 +410,16 @@ def _extract_text_from_html(html: str) -> str:
 
 def _resolve_tasks_for_cards(pathspec: str):
     """Resolve a run/step/task pathspec to a list of (Task, label) pairs for card lookup."""
-    from metaflow import Run, Step, Task
-
     parts = pathspec.split("/")
     if len(parts) == 4:
-        task = Task(pathspec)
+        task = _task(pathspec)
         return [(task, task.pathspec)]
     elif len(parts) == 3:
-        step = Step(pathspec)
+        step = _step(pathspec)
         task = next(iter(step))
         return [(task, task.pathspec)]
     elif len(parts) == 2:
-        run = Run(pathspec)
+        run = _run(pathspec)
         tasks = []
         for step in run:
             for task in step:
@@ -256,18 +536,16 @@ def list_flows(last_n: int = 50, offset: int = 0, namespace: str | None = None)
                    Use get_config to find your default_namespace.
                    If omitted, returns all flows visible globally.
     """
-    import metaflow as mf
+    mf = _mf()
 
     if namespace:
         mf.namespace(namespace)
     try:
         flows = []
-        skipped = 0
         has_more = False
-        for flow in mf.Metaflow():
-            if skipped < offset:
-                skipped += 1
-                continue
+        # islice skips the offset and bounds the page in C; one extra flow
+        # is pulled just to learn whether another page exists.
+        for flow in islice(mf.Metaflow(), offset, offset + last_n + 1):
             if len(flows) >= last_n:
                 has_more = True
                 break
@@ -298,9 +576,14 @@ def search_runs(
     created_before: str | None = None,
     tags: list[str] | None = None,
     namespace: str | None = None,
+    cursor: str | None = None,
 ) -> str:
     """Find recent runs of a flow with optional filters.
 
+    Returns newline-delimited JSON: a header line, one run per line,
+    and a footer line with the match count and a next_cursor for
+    resuming past the last returned run.
+
     Args:
         flow_name: Name of the flow class (e.g. "MyFlow").
         last_n: Max number of matching runs to return (default 5).
@@ -310,67 +593,94 @@ def search_runs(
         tags: Only include runs that have all of these user tags.
         namespace: Metaflow namespace to scope results (e.g. "user:npow").
                    Use get_config to find your default_namespace.
+        cursor: Run ID from a previous response's next_cursor -- resume
+                the scan just past that run.
     """
-    import metaflow as mf
-
-    if namespace:
-        mf.namespace(namespace)
-    try:
-        flow = mf.Flow(flow_name)
-    finally:
-        if namespace:
-            mf.namespace(None)
+    flow = _flow(flow_name, namespace)
 
     after_dt = _parse_dt(created_after) if created_after else None
     before_dt = _parse_dt(created_before) if created_before else None
 
-    runs = []
-    scanned = 0
+    # Fast path: the client resolves the latest successful run directly,
+    # skipping the scan loop (and its per-run property fetches) entirely.
+    if status == "successful" and last_n == 1 and not (after_dt or before_dt or tags or cursor):
+        run = flow.latest_successful_run
+        records = []
+        if run is not None:
+            fa = run.finished_at
+            records.append(
+                {
+                    "pathspec": run.pathspec,
+                    "id": run.id,
+                    "successful": True,
+                    "finished": True,
+                    "finished_at": fa,
+                    "created_at": run.created_at,
+                    "tags": sorted(run.user_tags),
+                }
+            )
+        return _ndjson({"flow": flow_name, "records": "runs"}, iter(records))
+
     MAX_SCAN = 200
+    required_tags = frozenset(tags) if tags else None
+    status_ok = _STATUS_PREDICATES.get(status, _STATUS_PREDICATES[None])
+    footer = {}
+
+    # Yield matches one at a time so _ndjson serializes each run as it is
+    # found instead of holding all matching records in memory.
+    def _records():
+        matched = 0
+        # Runs before (and including) the cursor were already returned on a
+        # previous page; skip until just past it.
+        skipping = cursor is not None
+        for run in islice(flow, MAX_SCAN):
+            if skipping:
+                if run.id == cursor:
+                    skipping = False
+                continue
 
-    for run in flow:
-        scanned += 1
-        if scanned > MAX_SCAN:
-            break
+            # One timestamp fetch per run: the window check, _ensure_tz,
+            # and the record all reuse the locals.
+            ca = run.created_at
+            created = _ensure_tz(ca)
 
-        created = _ensure_tz(run.created_at)
+            # Runs are reverse-chronological: stop once past the time window.
+            if after_dt and created < after_dt:
+                break
 
-        # Runs are reverse-chronological: stop once past the time window.
-        if after_dt and created < after_dt:
-            break
+            if before_dt and created > before_dt:
+                continue
 
-        if before_dt and created > before_dt:
-            continue
+            # Snapshot the status properties once: each access can hit the
+            # metadata service, and the record needs them again below.
+            successful = run.successful
+            finished = run.finished
 
-        if status:
-            if status == "successful" and not run.successful:
-                continue
-            elif status == "failed" and not (run.finished and not run.successful):
-                continue
-            elif status == "running" and run.finished:
+            if not status_ok(successful, finished):
                 continue
 
-        if tags:
+            # One tag fetch per run, shared by the filter and the record.
             user_tags = run.user_tags
-            if not all(t in user_tags for t in tags):
+            if required_tags is not None and not required_tags.issubset(user_tags):
                 continue
 
-        runs.append(
-            {
+            fa = run.finished_at
+            yield {
                 "pathspec": run.pathspec,
                 "id": run.id,
-                "successful": run.successful,
-                "finished": run.finished,
-                "finished_at": str(run.finished_at) if run.finished_at else None,
-                "created_at": str(run.created_at),
-                "tags": sorted(run.user_tags),
+                "successful": successful,
+                "finished": finished,
+                "finished_at": fa,
+                "created_at": ca,
+                "tags": sorted(user_tags),
             }
-        )
 
-        if len(runs) >= last_n:
-            break
+            footer["next_cursor"] = run.id
+            matched += 1
+            if matched >= last_n:
+                break
 
-    return _json({"flow": flow_name, "count": len(runs), "runs": runs})
+    return _ndjson({"flow": flow_name, "records": "runs"}, _records(), footer)
 
 
 @mcp.tool()
@@ -378,41 +688,81 @@ def search_runs(
 def get_run(pathspec: str) -> str:
     """Get detailed status of a run including per-step breakdown.
 
+    Returns newline-delimited JSON: a header line with run-level status,
+    one step (with its tasks) per line, and a footer line with the step count.
+
     Args:
         pathspec: Run pathspec like "FlowName/RunID".
     """
-    from metaflow import Run
+    run = _run(pathspec)
 
-    run = Run(pathspec)
-    steps = []
-    for step in run:
-        tasks = []
-        for task in step:
-            tasks.append(
-                {
-                    "id": task.id,
-                    "successful": task.successful,
-                    "finished": task.finished,
-                    "created_at": str(task.created_at),
-                    "finished_at": str(task.finished_at) if task.finished_at else None,
-                    "duration_seconds": _duration(task.created_at, task.finished_at),
-                }
-            )
-        steps.append(
-            {"step": step.id, "created_at": str(step.created_at), "tasks": tasks}
+    try:
+        # One bulk metadata query returns every task in the run; grouping in
+        # Python replaces the task-list query that list(step) would issue
+        # per step. The raw objects are attached to Task proxies so their
+        # properties read from the prefetched metadata.
+        from metaflow.client.core import Task as ClientTask
+
+        raw = run._metaflow.metadata.get_object(
+            "run", "task", {}, None, *run.path_components
         )
+        by_step = {}
+        for obj in raw or []:
+            by_step.setdefault(obj["step_name"], []).append(obj)
+    except Exception:
+        by_step = None  # internal API unavailable; walk step-by-step
+
+    def _step_tasks(step):
+        if by_step is not None:
+            try:
+                return [
+                    ClientTask(
+                        _object=obj,
+                        _parent=step,
+                        _metaflow=run._metaflow,
+                        _namespace_check=False,
+                    )
+                    for obj in by_step.get(step.id, [])
+                ]
+            except Exception:
+                pass  # private constructor changed; fall back per step
+        # Materialize the step's tasks in one pass (the client returns
+        # them in a single bulk response per step).
+        return list(step)
+
+    def _records():
+        for step in run:
+            step_tasks = _step_tasks(step)
+            # Read each property once into locals instead of re-triggering
+            # lazy lookups per field.
+            tasks = []
+            for task in step_tasks:
+                ca = task.created_at
+                fa = task.finished_at
+                tasks.append(
+                    {
+                        "id": task.id,
+                        "successful": task.successful,
+                        "finished": task.finished,
+                        "created_at": ca,
+                        "finished_at": fa,
+                        "duration_seconds": _duration(ca, fa),
+                    }
+                )
+            yield {"step": step.id, "created_at": step.created_at, "tasks": tasks}
 
-    return _json(
+    return _ndjson(
         {
             "pathspec": run.pathspec,
             "successful": run.successful,
             "finished": run.finished,
-            "created_at": str(run.created_at),
-            "finished_at": str(run.finished_at) if run.finished_at else None,
+            "created_at": run.created_at,
+            "finished_at": run.finished_at,
             "duration_seconds": _duration(run.created_at, run.finished_at),
             "tags": sorted(run.user_tags),
-            "steps": steps,
-        }
+            "records": "steps",
+        },
+        _records(),
     )
 
 
@@ -428,6 +778,7 @@ def get_task_logs(
     tail: int | None = None,
     head: int | None = None,
     pattern: str | None = None,
+    format: str = "json",
 ) -> str:
     """Get stdout/stderr logs for a specific task.
 
@@ -438,80 +789,97 @@ def get_task_logs(
         tail: Return only the last N lines of each log.
         head: Return only the first N lines of each log (ignored if tail is set).
         pattern: Regex pattern -- return only lines matching this pattern.
+        format: "json" (default) or "msgpack" for a base64-wrapped MessagePack
+                frame -- much smaller for multi-MB logs.
     """
-    from metaflow import Task
-
-    task = Task(pathspec)
+    task = _task(pathspec)
     result = {"pathspec": pathspec}
     if stdout:
-        result["stdout"] = _filter_log(
-            task.stdout, head=head, tail=tail, pattern=pattern
-        )
+        result["stdout"] = _task_log(task, "stdout", head=head, tail=tail, pattern=pattern)
     if stderr:
-        result["stderr"] = _filter_log(
-            task.stderr, head=head, tail=tail, pattern=pattern
-        )
-    return _json(result)
+        result["stderr"] = _task_log(task, "stderr", head=head, tail=tail, pattern=pattern)
+    return _encode(result, format)
 
 
 @mcp.tool()
 @_handle_errors
-def list_artifacts(pathspec: str) -> str:
+def list_artifacts(pathspec: str, include_preview: bool = False) -> str:
     """List all artifacts produced by a task (or the first task of a step).
 
-    Returns artifact names, data types, and metadata.
-    Use get_artifact to retrieve actual values.
+    Returns artifact names and metadata only -- computing a type or preview
+    would force downloading every artifact from the datastore, so that is
+    opt-in. Use get_artifact to retrieve actual values.
 
     Args:
         pathspec: Task pathspec like "FlowName/RunID/StepName/TaskID",
                   or step pathspec like "FlowName/RunID/StepName" (uses first task).
+        include_preview: Also load each artifact to report its Python type
+                         and a short repr. Slow for large artifacts.
     """
-    from metaflow import Step, Task
-
     parts = pathspec.split("/")
     if len(parts) == 3:
-        step = Step(pathspec)
+        step = _step(pathspec)
         task = next(iter(step))
     else:
-        task = Task(pathspec)
+        task = _task(pathspec)
 
     artifacts = []
     for art in task:
-        try:
-            art_type = type(art.data).__name__
-        except Exception:
-            art_type = "unknown"
-        artifacts.append(
-            {
-                "name": art.id,
-                "type": art_type,
-                "sha": art.sha,
-                "created_at": str(art.created_at),
-            }
-        )
+        record = {
+            "name": art.id,
+            "sha": art.sha,
+            "created_at": art.created_at,
+        }
+        if include_preview:
+            try:
+                data = art.data
+                record["type"] = type(data).__name__
+                record["preview"] = repr(data)[:80]
+            except Exception:
+                record["type"] = "unknown"
+        artifacts.append(record)
     return _json({"pathspec": task.pathspec, "artifacts": artifacts})
 
 
 @mcp.tool()
 @_handle_errors
-def get_artifact(pathspec: str, name: str) -> str:
+def get_artifact(pathspec: str, name: str, format: str = "json") -> str:
     """Get the value of a data artifact from a task.
 
     Args:
         pathspec: Task pathspec like "FlowName/RunID/StepName/TaskID".
         name: Artifact name (e.g. "model", "result").
+        format: "json" (default) returns repr(value); "msgpack" returns a
+                base64-wrapped MessagePack frame with bytes and array
+                buffers packed raw -- much smaller for numeric artifacts.
     """
-    from metaflow import Task
-
-    task = Task(pathspec)
+    task = _task(pathspec)
     artifact = task[name]
     value = artifact.data
+
+    if format == "msgpack":
+        if isinstance(value, (bytes, bytearray)):
+            raw = bytes(value)
+        elif hasattr(value, "tobytes"):  # numpy arrays and similar buffers
+            raw = value.tobytes()
+        else:
+            raw = _repr_offloaded(value)
+        return _encode(
+            {
+                "pathspec": pathspec,
+                "name": name,
+                "type": type(value).__name__,
+                "value": raw,
+            },
+            format,
+        )
+
     return _json(
         {
             "pathspec": pathspec,
             "name": name,
             "type": type(value).__name__,
-            "value": repr(value),
+            "value": _repr_offloaded(value),
         }
     )
 
@@ -542,7 +910,7 @@ def list_cards(
         card_type: Only list cards of this type (e.g. "default").
         card_id: Only list cards with this ID.
     """
-    from metaflow.cards import get_cards
+    get_cards = _get_cards()
 
     tasks = _resolve_tasks_for_cards(pathspec)
     all_cards = []
@@ -590,7 +958,7 @@ def get_card(
         card_type: Filter cards by type before selecting by index.
         card_id: Filter cards by ID before selecting by index.
     """
-    from metaflow.cards import get_cards
+    get_cards = _get_cards()
 
     tasks = _resolve_tasks_for_cards(pathspec)
     if not tasks:
@@ -667,7 +1035,7 @@ def compare_cards(
         card_id: Filter cards by ID before selecting.
         card_index: Which card to use if multiple match (default 0).
     """
-    from metaflow.cards import get_cards
+    get_cards = _get_cards()
 
     if pathspecs:
         resolved = pathspecs
@@ -749,65 +1117,61 @@ def get_latest_failure(flow_name: str, last_n_runs: int = 20, namespace: str | N
     Scans recent runs, finds all failures, and returns the failing
     step/task with exception and stderr for each.
 
+    Returns newline-delimited JSON: a header line, one failure per line,
+    and a footer line with the scan and failure counts.
+
     Args:
         flow_name: Name of the flow.
         last_n_runs: How many recent runs to scan (default 20).
         namespace: Metaflow namespace to scope results (e.g. "user:npow").
                    Use get_config to find your default_namespace.
     """
-    import metaflow as mf
-
-    if namespace:
-        mf.namespace(namespace)
-    try:
-        flow = mf.Flow(flow_name)
-    finally:
-        if namespace:
-            mf.namespace(None)
+    flow = _flow(flow_name, namespace)
 
-    failures = []
-    scanned = 0
-    for run in flow:
-        scanned += 1
-        if scanned > last_n_runs:
-            break
+    def _inspect(run):
+        """Return a failure record for a failed run, or None."""
         if not (run.finished and not run.successful):
-            continue
+            return None
 
         failure = {
             "run": run.pathspec,
-            "created_at": str(run.created_at),
+            "created_at": run.created_at,
             "failing_step": None,
             "failing_task": None,
             "exception": None,
             "stderr_tail": None,
         }
 
-        for step in run:
-            for task in step:
-                if task.finished and not task.successful:
-                    failure["failing_step"] = step.id
-                    failure["failing_task"] = task.pathspec
-                    failure["exception"] = (
-                        repr(task.exception) if task.exception else None
-                    )
-                    failure["stderr_tail"] = (task.stderr or "")[-2000:]
-                    break
-            if failure["failing_task"]:
-                break
-
-        if not failure["failing_task"]:
+        # Stop iterating the moment the first failing task is found instead
+        # of finishing out the step's task list before the breaks fire.
+        failing = next(
+            (
+                (step, task)
+                for step in run
+                for task in step
+                if task.finished and not task.successful
+            ),
+            None,
+        )
+        if failing is None:
             failure["note"] = "Run failed but could not identify failing task"
-        failures.append(failure)
-
-    return _json(
-        {
-            "flow": flow_name,
-            "runs_scanned": scanned,
-            "failures_found": len(failures),
-            "failures": failures,
-        }
-    )
+        else:
+            step, task = failing
+            failure["failing_step"] = step.id
+            failure["failing_task"] = task.pathspec
+            failure["exception"] = repr(task.exception) if task.exception else None
+            failure["stderr_tail"] = _tail_log(task, "stderr", 2000)
+        return failure
+
+    # Each run inspection is an independent chain of metadata fetches, so
+    # fan out across runs; executor.map keeps the reverse-chronological order.
+    runs = list(islice(flow, last_n_runs))
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        return _ndjson(
+            {"flow": flow_name, "records": "failures"},
+            (f for f in executor.map(_inspect, runs) if f is not None),
+            {"runs_scanned": len(runs)},
+        )
 
 
 @mcp.tool()
@@ -817,6 +1181,7 @@ def search_artifacts(
     artifact_name: str,
     last_n_runs: int = 5,
     step_name: str | None = None,
+    cursor: str | None = None,
 ) -> str:
     """Search for a named artifact across recent runs of a flow.
 
@@ -831,40 +1196,50 @@ def search_artifacts(
         artifact_name: Name of the artifact to search for (e.g. "model", "accuracy").
         last_n_runs: Number of recent runs to scan (default 5).
         step_name: Only search within this step (e.g. "train"). Recommended for large flows.
+        cursor: Run ID from a previous response's next_cursor -- resume
+                the scan just past that run.
     """
-    from metaflow import Flow
-
-    flow = Flow(flow_name)
-    results = []
-    scanned = 0
-    for run in flow:
-        scanned += 1
-        if scanned > last_n_runs:
-            break
+    flow = _flow(flow_name)
+
+    def _scan_run(run):
+        matches = []
         for step in run:
             if step_name and step.id != step_name:
                 continue
             for task in step:
                 for art in task:
                     if art.id == artifact_name:
-                        results.append(
+                        matches.append(
                             {
                                 "task": task.pathspec,
                                 "step": step.id,
                                 "run": run.pathspec,
-                                "created_at": str(art.created_at),
+                                "created_at": art.created_at,
                                 "sha": art.sha,
                             }
                         )
                         break  # Found in this task, move to next
+        return matches
+
+    # Scan runs in parallel — each one is a separate metadata walk.
+    run_iter = iter(flow)
+    if cursor:
+        # Skip runs already covered by a previous page.
+        for run in run_iter:
+            if run.id == cursor:
+                break
+    runs = list(islice(run_iter, last_n_runs))
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        results = [m for batch in executor.map(_scan_run, runs) for m in batch]
 
     return _json(
         {
             "flow": flow_name,
             "artifact_name": artifact_name,
-            "runs_scanned": scanned,
+            "runs_scanned": len(runs),
             "matches_found": len(results),
             "matches": results,
+            "next_cursor": runs[-1].id if runs else None,
         }
     )
 
@@ -891,14 +1266,12 @@ def get_source_code(
                    If omitted, returns the main flow file and a listing of
                    all files in the package.
     """
-    from metaflow import Run, Task
-
     parts = pathspec.split("/")
     if len(parts) == 2:
-        run = Run(pathspec)
+        run = _run(pathspec)
         code = run.code
     elif len(parts) == 4:
-        task = Task(pathspec)
+        task = _task(pathspec)
         code = task.code
     else:
         return _json({"error": "pathspec must be FlowName/RunID or FlowName/RunID/StepName/TaskID"})
@@ -962,6 +1335,9 @@ def get_recent_runs(
     user ran recently. Scans all flows in the namespace and returns runs sorted
     by creation time (newest first).
 
+    Returns newline-delimited JSON: a header line, one run per line,
+    and a footer line with the scan and run counts.
+
     Args:
         namespace: Metaflow namespace to scope results (e.g. "user:npow").
                    Use get_config to find your default_namespace.
@@ -969,55 +1345,59 @@ def get_recent_runs(
         last_n_runs_per_flow: How many recent runs to check per flow (default 3).
         status: Filter by status: "successful", "failed", or "running".
     """
-    import metaflow as mf
-
-    mf.namespace(namespace)
-    try:
-        all_runs = []
-        flows_scanned = 0
-        for flow in mf.Metaflow():
-            if flows_scanned >= last_n_flows:
-                break
-            flows_scanned += 1
-            count = 0
-            for run in flow:
-                if count >= last_n_runs_per_flow:
-                    break
-                count += 1
-                if status:
-                    if status == "successful" and not run.successful:
-                        continue
-                    elif status == "failed" and not (run.finished and not run.successful):
-                        continue
-                    elif status == "running" and run.finished:
-                        continue
-                all_runs.append(
+    mf = _mf()
+
+    status_ok = _STATUS_PREDICATES.get(status, _STATUS_PREDICATES[None])
+
+    def _collect(flow):
+        # Each row carries its sort key, computed once during collection:
+        # sorting on _ensure_tz(...) directly would normalize every
+        # created_at O(N log N) times.
+        rows = []
+        for run in islice(flow, last_n_runs_per_flow):
+            successful = run.successful
+            finished = run.finished
+            if not status_ok(successful, finished):
+                continue
+            ca = run.created_at
+            fa = run.finished_at
+            sort_key = _ensure_tz(ca) if ca else _EPOCH
+            rows.append(
+                (
+                    sort_key,
                     {
                         "pathspec": run.pathspec,
                         "flow": flow.id,
-                        "successful": run.successful,
-                        "finished": run.finished,
-                        "created_at": run.created_at,
-                        "finished_at": run.finished_at,
-                        "duration_seconds": _duration(run.created_at, run.finished_at),
+                        "successful": successful,
+                        "finished": finished,
+                        "created_at": ca,
+                        "finished_at": fa,
+                        "duration_seconds": _duration(ca, fa),
                         "tags": sorted(run.user_tags),
-                    }
+                    },
                 )
+            )
+        return rows
+
+    # The namespace is process-global state, so keep it set while the
+    # worker threads iterate runs, and restore it only once they are done.
+    mf.namespace(namespace)
+    try:
+        flows = list(islice(mf.Metaflow(), last_n_flows))
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            all_runs = [r for batch in executor.map(_collect, flows) for r in batch]
     finally:
         mf.namespace(None)
+    flows_scanned = len(flows)
 
-    all_runs.sort(key=lambda r: _ensure_tz(r["created_at"]) if r["created_at"] else datetime.min.replace(tzinfo=timezone.utc), reverse=True)
-    for r in all_runs:
-        r["created_at"] = str(r["created_at"])
-        r["finished_at"] = str(r["finished_at"]) if r["finished_at"] else None
+    # Sort on the precomputed keys; the encoder stringifies datetimes per
+    # record during serialization, so no second stringify pass is needed.
+    all_runs.sort(key=operator.itemgetter(0), reverse=True)
 
-    return _json(
-        {
-            "namespace": namespace,
-            "flows_scanned": flows_scanned,
-            "runs_found": len(all_runs),
-            "runs": all_runs,
-        }
+    return _ndjson(
+        {"namespace": namespace, "records": "runs"},
+        (row for _, row in all_runs),
+        {"flows_scanned": flows_scanned},
     )
 
 
@@ -1031,8 +1411,21 @@ def get_tool_schemas() -> list[dict]:
         from metaflow_mcp_server.server import get_tool_schemas
         for fn in get_tool_schemas():
             print(fn['name'], fn['signature'])
+
+    If METAFLOW_MCP_SCHEMA_CACHE points at a JSON file (written by
+    benchmarks.api_docs.dump_api_schema_cache), it is loaded directly
+    instead of re-introspecting every tool function.
     """
     import inspect
+    import os
+
+    cache_path = os.environ.get("METAFLOW_MCP_SCHEMA_CACHE")
+    if cache_path:
+        try:
+            with open(cache_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            pass  # stale or unreadable cache: fall through to introspection
 
     tool_fns = [
         get_config,
@@ -0,0 +1,21 @@
+"""Shared pytest configuration for the test suite."""
+
+import asyncio
+import sys
+
+
+def pytest_asyncio_loop_factories(config, item):
+    """Run the test event loops on uvloop when it is installed.
+
+    pytest-asyncio requires an implemented hook to return a non-empty
+    mapping, so the stdlib loop is handed back explicitly when uvloop is
+    absent or on Windows (where it does not build).
+    """
+    if sys.platform != "win32":
+        try:
+            import uvloop
+
+            return {"uvloop": uvloop.new_event_loop}
+        except ImportError:
+            pass
+    return {"asyncio": asyncio.new_event_loop}
@@ -5,9 +5,9 @@ Tests that require a Metaflow backend are marked with @pytest.mark.integration
 and skipped in CI unless METAFLOW_MCP_INTEGRATION=1 is set.
 """
 
-import asyncio
 import json
 import os
+from datetime import datetime, timezone, timedelta
 
 import pytest
 
@@ -16,26 +16,48 @@ from metaflow_mcp_server.server import mcp, _filter_log, _parse_dt, _ensure_tz,
 INTEGRATION = os.environ.get("METAFLOW_MCP_INTEGRATION") == "1"
 
 
-@pytest.fixture
+def _parse_response(text):
+    """Parse a tool response: a plain JSON document, or a streamed NDJSON
+    response (header line, one record per line, footer line), which is
+    reassembled into a single dict keyed by the header's "records" name."""
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        lines = [json.loads(line) for line in text.splitlines()]
+        header, records, footer = lines[0], lines[1:-1], lines[-1]
+        merged = {**header, **footer}
+        merged[header["records"]] = records
+        return merged
+
+
+@pytest.fixture(scope="session")
+async def tools():
+    """The registered tool list, fetched once -- the tool set is static."""
+    return await mcp.list_tools()
+
+
+@pytest.fixture(scope="session")
+def tools_by_name(tools):
+    """Tools indexed by name, built once for the schema tests."""
+    return {t.name: t for t in tools}
+
+
+@pytest.fixture(scope="session")
 def run_tool():
     """Helper to call an MCP tool and return parsed JSON."""
 
     async def _call(name, args=None):
         result = await mcp.call_tool(name, args or {})
         text = result[0][0].text
-        return json.loads(text)
+        return _parse_response(text)
 
-    def _sync_call(name, args=None):
-        return asyncio.get_event_loop().run_until_complete(_call(name, args))
-
-    return _sync_call
+    return _call
 
 
 class TestToolRegistration:
     """All tools should be registered with correct names and schemas."""
 
-    def test_tools_registered(self):
-        tools = asyncio.get_event_loop().run_until_complete(mcp.list_tools())
+    async def test_tools_registered(self, tools):
         names = {t.name for t in tools}
         expected = {
             "get_config",
@@ -55,89 +77,54 @@ class TestToolRegistration:
         }
         assert expected == names
 
-    def test_all_tools_have_descriptions(self):
-        tools = asyncio.get_event_loop().run_until_complete(mcp.list_tools())
+    async def test_all_tools_have_descriptions(self, tools):
         for tool in tools:
             assert tool.description, f"{tool.name} has no description"
 
-    def test_search_runs_has_params(self):
-        tools = asyncio.get_event_loop().run_until_complete(mcp.list_tools())
-        search = next(t for t in tools if t.name == "search_runs")
-        props = search.inputSchema["properties"]
-        assert "flow_name" in props
-        assert "last_n" in props
-        assert "status" in props
-        assert "created_after" in props
-        assert "created_before" in props
-        assert "tags" in props
-
-    def test_get_artifact_has_params(self):
-        tools = asyncio.get_event_loop().run_until_complete(mcp.list_tools())
-        tool = next(t for t in tools if t.name == "get_artifact")
-        props = tool.inputSchema["properties"]
-        assert "pathspec" in props
-        assert "name" in props
-
-    def test_get_task_logs_has_params(self):
-        tools = asyncio.get_event_loop().run_until_complete(mcp.list_tools())
-        tool = next(t for t in tools if t.name == "get_task_logs")
-        props = tool.inputSchema["properties"]
-        assert "pathspec" in props
-        assert "tail" in props
-        assert "head" in props
-        assert "pattern" in props
-
-    def test_list_flows_has_params(self):
-        tools = asyncio.get_event_loop().run_until_complete(mcp.list_tools())
-        tool = next(t for t in tools if t.name == "list_flows")
-        props = tool.inputSchema["properties"]
-        assert "last_n" in props
-        assert "offset" in props
-
-    def test_search_artifacts_has_params(self):
-        tools = asyncio.get_event_loop().run_until_complete(mcp.list_tools())
-        tool = next(t for t in tools if t.name == "search_artifacts")
-        props = tool.inputSchema["properties"]
-        assert "flow_name" in props
-        assert "artifact_name" in props
-        assert "last_n_runs" in props
-        assert "step_name" in props
-
-    def test_get_latest_failure_has_params(self):
-        tools = asyncio.get_event_loop().run_until_complete(mcp.list_tools())
-        tool = next(t for t in tools if t.name == "get_latest_failure")
-        props = tool.inputSchema["properties"]
-        assert "flow_name" in props
-        assert "last_n_runs" in props
-
-    def test_list_cards_has_params(self):
-        tools = asyncio.get_event_loop().run_until_complete(mcp.list_tools())
-        tool = next(t for t in tools if t.name == "list_cards")
-        props = tool.inputSchema["properties"]
-        assert "pathspec" in props
-        assert "card_type" in props
-        assert "card_id" in props
-
-    def test_get_card_has_params(self):
-        tools = asyncio.get_event_loop().run_until_complete(mcp.list_tools())
-        tool = next(t for t in tools if t.name == "get_card")
-        props = tool.inputSchema["properties"]
-        assert "pathspec" in props
-        assert "card_index" in props
-        assert "card_type" in props
-        assert "card_id" in props
-
-    def test_compare_cards_has_params(self):
-        tools = asyncio.get_event_loop().run_until_complete(mcp.list_tools())
-        tool = next(t for t in tools if t.name == "compare_cards")
-        props = tool.inputSchema["properties"]
-        assert "pathspecs" in props
-        assert "flow_name" in props
-        assert "step_name" in props
-        assert "run_ids" in props
-        assert "card_type" in props
-        assert "card_id" in props
-        assert "card_index" in props
+    @pytest.mark.parametrize(
+        ("tool_name", "expected"),
+        [
+            ("list_flows", {"last_n", "offset", "namespace"}),
+            (
+                "search_runs",
+                {
+                    "flow_name",
+                    "last_n",
+                    "status",
+                    "created_after",
+                    "created_before",
+                    "tags",
+                    "namespace",
+                    "cursor",
+                },
+            ),
+            ("get_run", {"pathspec"}),
+            ("get_task_logs", {"pathspec", "stdout", "stderr", "tail", "head", "pattern", "format"}),
+            ("list_artifacts", {"pathspec", "include_preview"}),
+            ("get_artifact", {"pathspec", "name", "format"}),
+            ("list_cards", {"pathspec", "card_type", "card_id"}),
+            ("get_card", {"pathspec", "card_index", "card_type", "card_id"}),
+            (
+                "compare_cards",
+                {
+                    "pathspecs",
+                    "flow_name",
+                    "step_name",
+                    "run_ids",
+                    "card_type",
+                    "card_id",
+                    "card_index",
+                },
+            ),
+            ("get_latest_failure", {"flow_name", "last_n_runs", "namespace"}),
+            ("search_artifacts", {"flow_name", "artifact_name", "last_n_runs", "step_name", "cursor"}),
+            ("get_recent_runs", {"namespace", "last_n_flows", "last_n_runs_per_flow", "status"}),
+            ("get_source_code", {"pathspec"}),
+        ],
+    )
+    async def test_tool_has_params(self, tools_by_name, tool_name, expected):
+        props = tools_by_name[tool_name].inputSchema["properties"]
+        assert expected <= props.keys()
 
 
 class TestHelpers:
@@ -176,51 +163,45 @@ class TestHelpers:
         result = _filter_log(text, head=1, tail=1)
         assert result == "d\n"
 
-    def test_parse_dt_naive(self):
-        from datetime import timezone
-        dt = _parse_dt("2024-01-15")
-        assert dt.tzinfo == timezone.utc
-
-    def test_parse_dt_with_tz(self):
-        dt = _parse_dt("2024-01-15T10:30:00+05:00")
-        assert dt.tzinfo is not None
-
-    def test_parse_dt_full_iso(self):
-        dt = _parse_dt("2024-01-15T10:30:00")
-        assert dt.year == 2024
-        assert dt.month == 1
-        assert dt.day == 15
-        assert dt.hour == 10
-        assert dt.minute == 30
-
-    def test_ensure_tz_naive(self):
-        from datetime import datetime, timezone
-        naive = datetime(2024, 1, 1)
-        result = _ensure_tz(naive)
-        assert result.tzinfo == timezone.utc
-
-    def test_ensure_tz_already_aware(self):
-        from datetime import datetime, timezone, timedelta
-        aware = datetime(2024, 1, 1, tzinfo=timezone(timedelta(hours=5)))
-        result = _ensure_tz(aware)
-        assert result.tzinfo == timezone(timedelta(hours=5))
-
-    def test_ensure_tz_none(self):
-        assert _ensure_tz(None) is None
-
-    def test_duration_basic(self):
-        from datetime import datetime
-        start = datetime(2024, 1, 1, 10, 0, 0)
-        end = datetime(2024, 1, 1, 10, 5, 30)
-        assert _duration(start, end) == 330.0
-
-    def test_duration_none_start(self):
-        from datetime import datetime
-        assert _duration(None, datetime(2024, 1, 1)) is None
-
-    def test_duration_none_end(self):
-        from datetime import datetime
-        assert _duration(datetime(2024, 1, 1), None) is None
+    @pytest.mark.parametrize(
+        ("value", "check"),
+        [
+            ("2024-01-15", lambda dt: dt.tzinfo == timezone.utc),
+            ("2024-01-15T10:30:00+05:00", lambda dt: dt.tzinfo is not None),
+            (
+                "2024-01-15T10:30:00",
+                lambda dt: (dt.year, dt.month, dt.day, dt.hour, dt.minute)
+                == (2024, 1, 15, 10, 30),
+            ),
+        ],
+    )
+    def test_parse_dt(self, value, check):
+        assert check(_parse_dt(value))
+
+    @pytest.mark.parametrize(
+        ("value", "check"),
+        [
+            (datetime(2024, 1, 1), lambda r: r.tzinfo == timezone.utc),
+            (
+                datetime(2024, 1, 1, tzinfo=timezone(timedelta(hours=5))),
+                lambda r: r.tzinfo == timezone(timedelta(hours=5)),
+            ),
+            (None, lambda r: r is None),
+        ],
+    )
+    def test_ensure_tz(self, value, check):
+        assert check(_ensure_tz(value))
+
+    @pytest.mark.parametrize(
+        ("start", "end", "expected"),
+        [
+            (datetime(2024, 1, 1, 10, 0, 0), datetime(2024, 1, 1, 10, 5, 30), 330.0),
+            (None, datetime(2024, 1, 1), None),
+            (datetime(2024, 1, 1), None, None),
+        ],
+    )
+    def test_duration(self, start, end, expected):
+        assert _duration(start, end) == expected
 
     def test_extract_text_basic(self):
         html = "<html><body><h1>Title</h1><p>Hello world</p></body></html>"
@@ -243,51 +224,58 @@ class TestHelpers:
 class TestErrorHandling:
     """Tools should return structured errors, not crash."""
 
-    def test_bad_flow_name(self, run_tool):
-        result = run_tool("search_runs", {"flow_name": "NonExistent__12345"})
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    async def _warm_server(cls):
+        """One list_tools() round trip up front, so no individual test
+        below pays the server's lazy first-call setup."""
+        await mcp.list_tools()
+
+    async def test_bad_flow_name(self, run_tool):
+        result = await run_tool("search_runs", {"flow_name": "NonExistent__12345"})
         assert "error" in result
         assert "MetaflowNotFound" in result["error"]
 
-    def test_bad_pathspec(self, run_tool):
-        result = run_tool("get_run", {"pathspec": "FakeFlow/99999999"})
+    async def test_bad_pathspec(self, run_tool):
+        result = await run_tool("get_run", {"pathspec": "FakeFlow/99999999"})
         assert "error" in result
 
-    def test_bad_artifact_name(self, run_tool):
-        result = run_tool("get_artifact", {"pathspec": "F/1/s/1", "name": "nope"})
+    async def test_bad_artifact_name(self, run_tool):
+        result = await run_tool("get_artifact", {"pathspec": "F/1/s/1", "name": "nope"})
         assert "error" in result
 
-    def test_bad_flow_list_flows(self, run_tool):
+    async def test_bad_flow_list_flows(self, run_tool):
         # list_flows should work even if no flows exist (returns empty list)
         # This test just verifies it doesn't crash
-        result = run_tool("list_flows", {"last_n": 1})
+        result = await run_tool("list_flows", {"last_n": 1})
         assert "flows" in result or "error" in result
 
-    def test_list_flows_pagination_fields(self, run_tool):
-        result = run_tool("list_flows", {"last_n": 1, "offset": 0})
+    async def test_list_flows_pagination_fields(self, run_tool):
+        result = await run_tool("list_flows", {"last_n": 1, "offset": 0})
         assert "offset" in result
         assert "has_more" in result
 
-    def test_bad_search_artifacts(self, run_tool):
-        result = run_tool(
+    async def test_bad_search_artifacts(self, run_tool):
+        result = await run_tool(
             "search_artifacts",
             {"flow_name": "NonExistent__12345", "artifact_name": "x"},
         )
         assert "error" in result
 
-    def test_list_cards_bad_pathspec(self, run_tool):
-        result = run_tool("list_cards", {"pathspec": "FakeFlow/99999999"})
+    async def test_list_cards_bad_pathspec(self, run_tool):
+        result = await run_tool("list_cards", {"pathspec": "FakeFlow/99999999"})
         assert "error" in result
 
-    def test_get_card_bad_pathspec(self, run_tool):
-        result = run_tool("get_card", {"pathspec": "FakeFlow/99999999/step"})
+    async def test_get_card_bad_pathspec(self, run_tool):
+        result = await run_tool("get_card", {"pathspec": "FakeFlow/99999999/step"})
         assert "error" in result
 
-    def test_compare_cards_missing_args(self, run_tool):
-        result = run_tool("compare_cards", {})
+    async def test_compare_cards_missing_args(self, run_tool):
+        result = await run_tool("compare_cards", {})
         assert "error" in result
 
-    def test_compare_cards_too_few(self, run_tool):
-        result = run_tool("compare_cards", {"pathspecs": ["MyFlow/1/step/0"]})
+    async def test_compare_cards_too_few(self, run_tool):
+        result = await run_tool("compare_cards", {"pathspecs": ["MyFlow/1/step/0"]})
         assert "error" in result
 
 
@@ -295,45 +283,60 @@ class TestErrorHandling:
 class TestIntegration:
     """Tests that hit a real Metaflow backend."""
 
-    def test_get_config(self, run_tool):
-        result = run_tool("get_config")
+    @pytest.fixture(scope="class")
+    @classmethod
+    def any_flow_name(cls):
+        """A flow name from the backend, discovered once for the class."""
+        from metaflow import Metaflow
+
+        flow = next(iter(Metaflow()), None)
+        if flow is None:
+            pytest.skip("No flows available")
+        return flow.id
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    async def sample_task_path(cls, run_tool, any_flow_name):
+        """Pathspec of a task from the latest run, resolved once for the class."""
+        runs = await run_tool("search_runs", {"flow_name": any_flow_name, "last_n": 1})
+        if runs["count"] == 0:
+            pytest.skip("No runs available")
+        pathspec = runs["runs"][0]["pathspec"]
+        run = await run_tool("get_run", {"pathspec": pathspec})
+        first_step = run["steps"][-1]
+        return f"{pathspec}/{first_step['step']}/{first_step['tasks'][0]['id']}"
+
+    async def test_get_config(self, run_tool):
+        result = await run_tool("get_config")
         assert "metadata_provider" in result
         assert "default_datastore" in result
 
-    def test_list_flows(self, run_tool):
-        result = run_tool("list_flows", {"last_n": 5})
+    async def test_list_flows(self, run_tool):
+        result = await run_tool("list_flows", {"last_n": 5})
         assert "flows" in result
         assert "count" in result
         assert "has_more" in result
         assert "offset" in result
 
-    def test_list_flows_pagination(self, run_tool):
+    async def test_list_flows_pagination(self, run_tool):
         # Get first page
-        page1 = run_tool("list_flows", {"last_n": 2, "offset": 0})
+        page1 = await run_tool("list_flows", {"last_n": 2, "offset": 0})
         assert page1["count"] <= 2
         assert page1["offset"] == 0
         if page1["has_more"]:
             # Get second page
-            page2 = run_tool("list_flows", {"last_n": 2, "offset": 2})
+            page2 = await run_tool("list_flows", {"last_n": 2, "offset": 2})
             assert page2["offset"] == 2
             # Pages should not overlap
             assert set(page1["flows"]).isdisjoint(set(page2["flows"]))
 
-    def test_search_and_drill(self, run_tool):
-        # Find any flow with runs
-        from metaflow import Metaflow
-
-        flows = list(Metaflow())
-        if not flows:
-            pytest.skip("No flows available")
-
-        flow_name = flows[0].id
-        runs = run_tool("search_runs", {"flow_name": flow_name, "last_n": 1})
+    async def test_search_and_drill(self, run_tool, any_flow_name, sample_task_path):
+        runs = await run_tool("search_runs", {"flow_name": any_flow_name, "last_n": 1})
         assert runs["count"] >= 1
 
         # Drill into the run
         pathspec = runs["runs"][0]["pathspec"]
-        run = run_tool("get_run", {"pathspec": pathspec})
+        run = await run_tool("get_run", {"pathspec": pathspec})
         assert "steps" in run
         assert len(run["steps"]) > 0
         # Verify timing info is present
@@ -345,13 +348,8 @@ class TestIntegration:
                 assert "created_at" in task
                 assert "duration_seconds" in task
 
-        # List artifacts from first step (no data loading)
-        first_step = run["steps"][-1]
-        task_id = first_step["tasks"][0]["id"]
-        step_name = first_step["step"]
-        task_path = f"{pathspec}/{step_name}/{task_id}"
-
-        artifacts = run_tool("list_artifacts", {"pathspec": task_path})
+        # List artifacts from a task (no data loading)
+        artifacts = await run_tool("list_artifacts", {"pathspec": sample_task_path})
         assert "artifacts" in artifacts
         # Verify no type/size fields (data not loaded)
         for art in artifacts["artifacts"]:
@@ -359,40 +357,15 @@ class TestIntegration:
             assert "sha" in art
             assert "created_at" in art
 
-    def test_search_runs_with_status_filter(self, run_tool):
-        from metaflow import Metaflow
-
-        flows = list(Metaflow())
-        if not flows:
-            pytest.skip("No flows available")
-
-        flow_name = flows[0].id
+    async def test_search_runs_with_status_filter(self, run_tool, any_flow_name):
         # Filter by successful runs
-        result = run_tool(
+        result = await run_tool(
             "search_runs",
-            {"flow_name": flow_name, "last_n": 3, "status": "successful"},
+            {"flow_name": any_flow_name, "last_n": 3, "status": "successful"},
         )
         for run in result["runs"]:
             assert run["successful"] is True
 
-    def test_get_task_logs_with_tail(self, run_tool):
-        from metaflow import Metaflow
-
-        flows = list(Metaflow())
-        if not flows:
-            pytest.skip("No flows available")
-
-        flow_name = flows[0].id
-        runs = run_tool("search_runs", {"flow_name": flow_name, "last_n": 1})
-        if runs["count"] == 0:
-            pytest.skip("No runs available")
-
-        pathspec = runs["runs"][0]["pathspec"]
-        run = run_tool("get_run", {"pathspec": pathspec})
-        first_step = run["steps"][-1]
-        task_id = first_step["tasks"][0]["id"]
-        step_name = first_step["step"]
-        task_path = f"{pathspec}/{step_name}/{task_id}"
-
-        result = run_tool("get_task_logs", {"pathspec": task_path, "tail": 5})
+    async def test_get_task_logs_with_tail(self, run_tool, sample_task_path):
+        result = await run_tool("get_task_logs", {"pathspec": sample_task_path, "tail": 5})
         assert "stdout" in result or "stderr" in result